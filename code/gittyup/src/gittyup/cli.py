@@ -4,17 +4,230 @@ Command-line interface for Gitty Up.
 This module provides the main CLI entry point and command handling.
 """
 
+import logging
+import os
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Set, Tuple, Union
 import click
 from .scanner import RepositoryScanner
 from .git_operations import GitOperations
 from .output import OutputFormatter
-from .output_rich import RichOutputFormatter
 from .config import Config, ConfigError
-from .logger import GittyUpLogger
 from .exceptions import GitNotFoundError, ScanError
+from .models import (
+    MSG_FETCHED_RECENTLY,
+    MSG_NO_UPSTREAM,
+    MSG_UP_TO_DATE,
+    RepoState,
+    RepoStatus,
+    SummaryStats,
+)
+
+if TYPE_CHECKING:
+    from .logger import GittyUpLogger
+    from .output_rich import RichOutputFormatter
+
+# Rich and the file logger are imported inside main() when needed, so that
+# --help, --version and option errors don't pay for loading them.
+
+
+def _process_repo(repo: Path, cfg: Config, dry_run: bool) -> RepoStatus:
+    """
+    Check and update a single repository.
+
+    Runs in a worker thread, so it only talks to Git and returns a result;
+    printing and logging are left to the caller.
+
+    Args:
+        repo: Path to the Git repository
+        cfg: Active configuration
+        dry_run: Whether to simulate the pull
+
+    Returns:
+        RepoStatus describing the outcome
+    """
+    # Skip repositories fetched recently enough, before starting any git process
+    min_fetch_interval = cfg.get("min_fetch_interval_seconds", 0)
+    if min_fetch_interval > 0:
+        fetch_age = GitOperations.seconds_since_fetch(repo)
+        if fetch_age is not None and fetch_age < min_fetch_interval:
+            return RepoStatus(path=repo, state=RepoState.SKIPPED, message=MSG_FETCHED_RECENTLY)
+
+    # One git status call reports both dirtiness and upstream
+    snapshot = GitOperations.get_full_status(repo)
+
+    # Check repository status if skip_dirty is enabled
+    if cfg.get("skip_dirty", True) and not dry_run and not snapshot.is_clean:
+        return RepoStatus(path=repo, state=RepoState.SKIPPED, message=snapshot.message)
+
+    # Check if repository has upstream
+    if not snapshot.upstream:
+        return RepoStatus(path=repo, state=RepoState.SKIPPED, message=MSG_NO_UPSTREAM)
+
+    # Pull changes (or simulate in dry-run mode)
+    if dry_run:
+        return RepoStatus(path=repo, state=RepoState.DRY_RUN)
+
+    success, message = GitOperations.pull_repository(repo, timeout=cfg.get("timeout_seconds", 30))
+    if not success:
+        return RepoStatus(path=repo, state=RepoState.FAILED, message=message)
+
+    # Count what the pull brought in rather than trusting git's wording
+    commits_pulled = None
+    if snapshot.head:
+        commits_pulled = GitOperations.count_new_commits(repo, snapshot.head)
+    if commits_pulled is None:
+        commits_pulled = 0 if message == MSG_UP_TO_DATE else None
+    elif commits_pulled == 0:
+        message = MSG_UP_TO_DATE
+
+    return RepoStatus(
+        path=repo, state=RepoState.SUCCESS, message=message, commits_pulled=commits_pulled
+    )
+
+
+# Adaptive worker limits used when max_workers isn't configured
+_AUTO_INITIAL_WORKERS = 8
+_AUTO_MAX_WORKERS = 32
+# Wall time this many times the CPU time means workers are mostly waiting on I/O
+_IO_BOUND_RATIO = 3
+
+
+def _cpu_time() -> float:
+    """
+    Return the CPU time used so far by this process and its finished children.
+
+    The pulls run in git child processes, so their CPU only shows up in the
+    children fields once subprocess.run has reaped them. Those fields are
+    always zero on Windows, where the pool therefore grows to its maximum.
+    """
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _timed_process_repo(repo: Path, cfg: Config, dry_run: bool) -> Tuple[RepoStatus, float]:
+    """Run _process_repo and return its result with the wall time it took."""
+    start = time.perf_counter()
+    result = _process_repo(repo, cfg, dry_run)
+    return result, time.perf_counter() - start
+
+
+def _run_updates(
+    repositories: Iterable[Path], cfg: Config, dry_run: bool, logger: "GittyUpLogger"
+) -> Iterator[RepoStatus]:
+    """
+    Process repositories on a thread pool and yield results as they finish.
+
+    With parallel_operations enabled and no explicit max_workers, the number
+    of repositories in flight starts at 8 and doubles (up to 32) whenever the
+    last batch of updates spent most of its wall time waiting rather than on
+    CPU in this process or its git children — the usual case for
+    network-bound pulls.
+
+    Repositories are taken from the iterable only as workers free up, so it
+    may be a scan that is still in progress. If the scan fails, the updates
+    already running are finished and yielded before the ScanError is raised.
+
+    Args:
+        repositories: Repositories to process
+        cfg: Active configuration
+        dry_run: Whether to simulate the pulls
+        logger: Logger for per-repository start messages
+
+    Yields:
+        RepoStatus for each repository, in completion order
+
+    Raises:
+        ScanError: If the scan feeding the repositories fails
+    """
+    configured_workers = cfg.get("max_workers")
+    if not cfg.get("parallel_operations"):
+        limit = ceiling = 1
+    elif configured_workers:
+        limit = ceiling = configured_workers
+    else:
+        limit = _AUTO_INITIAL_WORKERS
+        ceiling = _AUTO_MAX_WORKERS
+
+    queued = iter(repositories)
+    in_flight: Set[Future] = set()
+    scan_error: Optional[ScanError] = None
+    sampled = 0
+    wall_total = 0.0
+    cpu_start = _cpu_time()
+
+    with ThreadPoolExecutor(max_workers=ceiling) as executor:
+
+        def fill() -> None:
+            nonlocal scan_error
+            while scan_error is None and len(in_flight) < limit:
+                try:
+                    repo = next(queued, None)
+                except ScanError as e:
+                    # Stop taking work, but let the running updates report first
+                    scan_error = e
+                    return
+                if repo is None:
+                    return
+                logger.log_repo_update_start(os.fspath(repo))
+                in_flight.add(executor.submit(_timed_process_repo, repo, cfg, dry_run))
+
+        fill()
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.remove(future)
+                result, wall = future.result()
+                sampled += 1
+                wall_total += wall
+                yield result
+
+            # Re-evaluate after each full batch of results
+            if limit < ceiling and sampled >= limit:
+                cpu_now = _cpu_time()
+                if wall_total > _IO_BOUND_RATIO * (cpu_now - cpu_start):
+                    limit = min(limit * 2, ceiling)
+                sampled = 0
+                wall_total = 0.0
+                cpu_start = cpu_now
+
+            fill()
+
+    if scan_error is not None:
+        raise scan_error
+
+
+def _scanned_repositories(
+    first_repo: Path,
+    rest: Iterator[Path],
+    logger: "GittyUpLogger",
+    output: Union[OutputFormatter, "RichOutputFormatter"],
+    start_time: float,
+) -> Iterator[Path]:
+    """
+    Yield repositories from a running scan and report the total once it finishes.
+
+    Args:
+        first_repo: Repository already taken from the scan
+        rest: The remaining scan results
+        logger: Logger for the scan completion message
+        output: Formatter that prints the scan completion line
+        start_time: When the scan started, from time.time()
+
+    Yields:
+        Each repository path, in discovery order
+    """
+    yield first_repo
+    count = 1
+    for repo in rest:
+        count += 1
+        yield repo
+    # Updates may still be running, so this is reported as the end of the scan
+    # rather than as the count that comes before any update
+    output.print_scan_complete(count)
+    logger.log_scan_complete(count, time.time() - start_time)
 
 
 @click.command()
@@ -39,6 +252,11 @@ from .exceptions import GitNotFoundError, ScanError
     default=None,
     help="Skip repositories with uncommitted changes",
 )
+@click.option(
+    "--parallel/--no-parallel",
+    default=None,
+    help="Update repositories in parallel",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -77,6 +295,7 @@ def main(
     max_depth: Optional[int],
     exclude: tuple,
     skip_dirty: Optional[bool],
+    parallel: Optional[bool],
     dry_run: bool,
     verbose: bool,
     quiet: bool,
@@ -96,6 +315,7 @@ def main(
         gittyup                    # Update repos in current directory
         gittyup ~/projects         # Update repos in ~/projects
         gittyup --dry-run          # See what would happen
+        gittyup --parallel         # Update repos in parallel
         gittyup --exclude venv     # Exclude specific directories
         gittyup -v                 # Verbose output
         gittyup -q                 # Quiet mode
@@ -122,6 +342,7 @@ def main(
             "max_depth": max_depth,
             "exclude_patterns": list(exclude) if exclude else None,
             "skip_dirty": skip_dirty,
+            "parallel_operations": parallel,
             "verbose": verbose,
             "quiet": quiet,
         }
@@ -135,18 +356,27 @@ def main(
         raise SystemExit(1)
 
     # Initialize logger
+    from .logger import GittyUpLogger
+
+    # The log format never shows thread or process, so skip filling them in per
+    # record. These are process-wide, so they're only set by the command itself
+    logging.logThreads = False
+    logging.logProcesses = False
+
     logger = GittyUpLogger(enabled=not no_log)
     logger.info("Starting Gitty Up v0.2.0")
-    logger.info(f"Scanning path: {path}")
+    logger.info("Scanning path: %s", path)
 
     # Initialize output formatter
     if no_color or cfg.get("quiet"):
         # Use basic output formatter for no-color mode
-        output = OutputFormatter()
+        output = OutputFormatter(no_color=no_color)
         use_rich = False
     else:
         # Use Rich output formatter for enhanced experience
         try:
+            from .output_rich import RichOutputFormatter
+
             output = RichOutputFormatter(
                 verbose=cfg.get("verbose", False),
                 quiet=cfg.get("quiet", False),
@@ -178,7 +408,7 @@ def main(
     except GitNotFoundError as e:
         error_msg = str(e)
         output.print_error_message(error_msg)
-        logger.error(f"Git not available: {error_msg}")
+        logger.error("Git not available: %s", error_msg)
         raise SystemExit(1)
 
     # Scan for repositories
@@ -191,19 +421,17 @@ def main(
             max_depth=cfg.get("max_depth"),
             exclude_patterns=cfg.get("exclude_patterns"),
         )
-        repositories = scanner.scan()
-        scan_duration = time.time() - start_time
-        logger.log_scan_complete(len(repositories), scan_duration)
-
+        found = scanner.iter_repositories()
+        first_repo = next(found, None)
     except ScanError as e:
         error_msg = f"Scanning error: {e}"
         output.print_error_message(error_msg)
         logger.error(error_msg)
         raise SystemExit(1)
 
-    output.print_found_repos(len(repositories))
-
-    if len(repositories) == 0:
+    if first_repo is None:
+        logger.log_scan_complete(0, time.time() - start_time)
+        output.print_found_repos(0)
         logger.info("No repositories found, exiting")
         return
 
@@ -214,86 +442,78 @@ def main(
 
     output.print_updating()
 
-    # Counters for summary
-    updated_count = 0
-    skipped_count = 0
-    error_count = 0
-
-    # Get configuration values
-    skip_dirty_repos = cfg.get("skip_dirty", True)
-    timeout = cfg.get("timeout_seconds", 30)
-    show_uptodate = cfg.get("show_uptodate", True)
-
-    for repo in repositories:
-        repo_name = repo.name
-        logger.log_repo_update_start(str(repo))
-
-        # Check repository status if skip_dirty is enabled
-        if skip_dirty_repos and not dry_run:
-            is_clean, status_msg = GitOperations.get_repository_status(repo)
-            if not is_clean:
-                output.print_skipped(repo, status_msg)
-                logger.log_repo_update_skip(str(repo), status_msg)
-                skipped_count += 1
-                continue
-
-        # Check if repository has upstream
-        if not GitOperations.has_upstream(repo):
-            reason = "No upstream configured"
-            output.print_skipped(repo, reason)
-            logger.log_repo_update_skip(str(repo), reason)
-            skipped_count += 1
-            continue
-
-        # Pull changes (or simulate in dry-run mode)
-        if dry_run:
-            if cfg.get("verbose"):
-                output.print_info(f"Would pull {repo_name}")
-            logger.debug(f"Dry-run: would pull {repo_name}")
-            continue
-
-        success, message = GitOperations.pull_repository(repo, timeout=timeout)
-
-        if success:
-            # Check if already up to date
-            if "Already up to date" in message:
-                if show_uptodate or cfg.get("verbose"):
-                    output.print_success(repo, message)
-                logger.log_repo_update_success(str(repo), message)
+    # Get configuration values once, outside the per-repository loop
+    verbose_mode = cfg.get("verbose")
+    show_uptodate = cfg.get("show_uptodate", True) or verbose_mode
+
+    # When Rich output is redirected (CI logs, pipes) nobody watches lines arrive,
+    # so collect the results and render them as one table at the end instead
+    stream_results = not use_rich or verbose_mode or output.console.is_terminal
+
+    stats = SummaryStats()
+
+    # Pull while the scan keeps walking the rest of the tree
+    repositories = _scanned_repositories(first_repo, found, logger, output, start_time)
+
+    try:
+        for result in _run_updates(repositories, cfg, dry_run, logger):
+            stats.add_result(result)
+            repo = result.path
+            repo_str = os.fspath(repo)
+            repo_name = repo.name
+
+            state = result.state
+            if state is RepoState.SKIPPED:
+                if stream_results:
+                    output.print_skipped(repo_name, result.message)
+                logger.log_repo_update_skip(repo_str, result.message)
+            elif state is RepoState.DRY_RUN:
+                if verbose_mode:
+                    output.print_info(f"Would pull {repo_name}")
+                logger.debug("Dry-run: would pull %s", repo_name)
+            elif state is RepoState.SUCCESS:
+                # Already up to date repos are only shown when requested
+                if stream_results and (show_uptodate or not result.already_up_to_date):
+                    output.print_success(repo_name, result.message)
+                logger.log_repo_update_success(repo_str, result.message)
             else:
-                output.print_success(repo, message)
-                logger.log_repo_update_success(str(repo), message)
-            updated_count += 1
-        else:
-            output.print_error(repo, message)
-            logger.log_repo_update_error(str(repo), message)
-            error_count += 1
+                if stream_results:
+                    output.print_error(repo_name, result.message)
+                logger.log_repo_update_error(repo_str, result.message)
+    except ScanError as e:
+        error_msg = f"Scanning error: {e}"
+        output.print_error_message(error_msg)
+        logger.error(error_msg)
+        raise SystemExit(1)
+
+    if not stream_results:
+        output.print_results_table(stats.results, show_uptodate)
 
     # Calculate elapsed time
     elapsed_time = time.time() - start_time
 
     # Log operation summary
     logger.log_operation_summary(
-        total=len(repositories),
-        updated=updated_count,
-        skipped=skipped_count,
-        errors=error_count,
+        total=stats.total,
+        updated=stats.updated,
+        skipped=stats.skipped,
+        errors=stats.errors,
         duration=elapsed_time,
     )
 
     # Print summary
     if not dry_run:
         output.print_summary(
-            total=len(repositories),
-            updated=updated_count,
-            skipped=skipped_count,
-            errors=error_count,
+            total=stats.total,
+            updated=stats.updated,
+            skipped=stats.skipped,
+            errors=stats.errors,
             elapsed_time=elapsed_time,
         )
 
     # Exit with error code if there were errors
-    if error_count > 0:
-        logger.error(f"Operation completed with {error_count} errors")
+    if stats.errors > 0:
+        logger.error("Operation completed with %d errors", stats.errors)
         raise SystemExit(1)
 
     logger.info("Operation completed successfully")
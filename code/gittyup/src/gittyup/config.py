@@ -8,12 +8,25 @@ Handles loading and merging configuration from multiple sources:
 4. System defaults (lowest priority)
 """
 
+import hashlib
+import json
 import os
+from functools import cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 import yaml
 from .exceptions import GittyUpError
 
+# Prefer libyaml's C loader; PyYAML builds without libyaml only have the Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Returned by _read_cached_config when there is no usable cache entry
+_CACHE_MISS = object()
+
 
 class ConfigError(GittyUpError):
     """Raised when there's an error with configuration."""
@@ -21,37 +34,137 @@ class ConfigError(GittyUpError):
     pass
 
 
+@cache
+def _get_app_dir(xdg_value: Optional[str], home_fallback: str, home: Optional[str]) -> Path:
+    """
+    Resolve a Gitty Up directory under an XDG base directory.
+
+    Cached per XDG and HOME value so Path.home() (a pwd lookup on POSIX when
+    HOME is unset) runs once per process, while a change to either
+    environment variable still takes effect.
+
+    Args:
+        xdg_value: Value of the XDG environment variable, if set
+        home_fallback: Base directory relative to the home directory when unset
+        home: Value of HOME, which Path.home() reads; only part of the cache key
+
+    Returns:
+        Path to the gittyup directory
+    """
+    if xdg_value:
+        return Path(xdg_value) / "gittyup"
+    return Path.home() / home_fallback / "gittyup"
+
+
+def _get_cache_dir() -> Path:
+    """
+    Get the directory holding cached, already-parsed configuration files.
+
+    Returns:
+        Path to the cache directory (~/.cache/gittyup)
+    """
+    return _get_app_dir(os.environ.get("XDG_CACHE_HOME"), ".cache", os.environ.get("HOME"))
+
+
+def _get_cache_file(resolved_path: str) -> Path:
+    """Get the cache file that stores the parsed contents of a config file."""
+    digest = hashlib.sha256(resolved_path.encode()).hexdigest()[:32]
+    return _get_cache_dir() / f"yaml-{digest}.json"
+
+
+def _cache_key(resolved_path: str, st: os.stat_result) -> str:
+    """Build the key that invalidates a cache entry whenever the file changes."""
+    return f"{resolved_path}-{st.st_mtime_ns}-{st.st_size}"
+
+
+def _read_cached_config(cache_file: Path, key: str) -> Any:
+    """
+    Load a parsed config from the cache if it matches the given key.
+
+    Args:
+        cache_file: Cache file for the config
+        key: Expected cache key of the config file
+
+    Returns:
+        The cached config, or _CACHE_MISS if absent, stale or unreadable
+    """
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return _CACHE_MISS
+
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return _CACHE_MISS
+    return entry.get("config")
+
+
+def _write_cached_config(cache_file: Path, key: str, file_config: Any) -> None:
+    """
+    Store a parsed config in the cache, ignoring any failure.
+
+    Configs whose values JSON cannot round-trip exactly (dates, non-string
+    keys, ...) are not cached, so a cache hit always matches a fresh parse.
+
+    Args:
+        cache_file: Cache file for the config
+        key: Cache key of the config file
+        file_config: Parsed contents of the config file
+    """
+    try:
+        payload = json.dumps({"key": key, "config": file_config})
+        if json.loads(payload)["config"] != file_config:
+            return
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_text(payload, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
 class Config:
     """Configuration manager for Gitty Up."""
 
-    # Default configuration values
-    DEFAULTS: Dict[str, Any] = {
-        "max_depth": 10,
-        "exclude_patterns": [
-            "node_modules",
-            "venv",
-            ".venv",
-            "__pycache__",
-            ".tox",
-            "build",
-            "dist",
-        ],
-        "skip_dirty": True,
-        "timeout_seconds": 30,
-        "verbose": False,
-        "quiet": False,
-        "show_uptodate": True,
-        "parallel_operations": False,
-    }
+    # Default configuration values (read-only; exclude_patterns is a tuple so
+    # each instance gets its own list to extend)
+    DEFAULTS: Mapping[str, Any] = MappingProxyType(
+        {
+            "max_depth": 10,
+            "exclude_patterns": (
+                "node_modules",
+                "venv",
+                ".venv",
+                "__pycache__",
+                ".tox",
+                "build",
+                "dist",
+            ),
+            "skip_dirty": True,
+            "timeout_seconds": 30,
+            "min_fetch_interval_seconds": 0,
+            "verbose": False,
+            "quiet": False,
+            "show_uptodate": True,
+            "parallel_operations": False,
+            "max_workers": None,
+        }
+    )
 
     def __init__(self) -> None:
         """Initialize configuration with defaults."""
-        self.config: Dict[str, Any] = self.DEFAULTS.copy()
+        self.config: Dict[str, Any] = dict(self.DEFAULTS)
+        self.config["exclude_patterns"] = list(self.DEFAULTS["exclude_patterns"])
 
     def load_from_file(self, config_path: Path) -> None:
         """
         Load configuration from a YAML file.
 
+        The parsed contents are cached as JSON under ~/.cache/gittyup, keyed by
+        the file's modification time and size, so unchanged files are not
+        re-parsed on every run.
+
         Args:
             config_path: Path to the YAML configuration file
 
@@ -62,8 +175,16 @@ class Config:
             return
 
         try:
-            with open(config_path, "r") as f:
-                file_config = yaml.safe_load(f)
+            # Resolved once: both the cache file name and the key are built from it
+            resolved_path = str(config_path.resolve())
+            cache_file = _get_cache_file(resolved_path)
+            key = _cache_key(resolved_path, config_path.stat())
+            file_config = _read_cached_config(cache_file, key)
+
+            if file_config is _CACHE_MISS:
+                with open(config_path, "rb") as f:
+                    file_config = yaml.load(f, Loader=_YamlLoader)
+                _write_cached_config(cache_file, key, file_config)
 
             if file_config is None:
                 return
@@ -134,10 +255,14 @@ class Config:
                 # Special handling for exclude_patterns: extend the list
                 if key == "exclude_patterns" and isinstance(value, list):
                     if isinstance(self.config[key], list):
-                        # Extend existing list with new patterns (avoid duplicates)
-                        existing = set(self.config[key])
-                        new_patterns = [p for p in value if p not in existing]
-                        self.config[key].extend(new_patterns)
+                        # Extend existing list with new patterns, skipping duplicates
+                        # both against the list and within the new patterns
+                        patterns = self.config[key]
+                        seen = set(patterns)
+                        for pattern in value:
+                            if pattern not in seen:
+                                seen.add(pattern)
+                                patterns.append(pattern)
                     else:
                         self.config[key] = value
                 else:
@@ -177,15 +302,10 @@ class Config:
         Returns:
             Path to user config file (~/.config/gittyup/config.yaml)
         """
-        # Check for XDG_CONFIG_HOME first (Linux standard)
-        config_home = os.environ.get("XDG_CONFIG_HOME")
-        if config_home:
-            config_dir = Path(config_home) / "gittyup"
-        else:
-            # Fall back to ~/.config
-            home = Path.home()
-            config_dir = home / ".config" / "gittyup"
-
+        # Check for XDG_CONFIG_HOME first (Linux standard), falling back to ~/.config
+        config_dir = _get_app_dir(
+            os.environ.get("XDG_CONFIG_HOME"), ".config", os.environ.get("HOME")
+        )
         return config_dir / "config.yaml"
 
     def to_dict(self) -> Dict[str, Any]:
@@ -209,8 +329,11 @@ class Config:
             raise ConfigError("max_depth must be a positive integer")
 
         # Validate exclude_patterns
-        if not isinstance(self.config["exclude_patterns"], list):
+        exclude_patterns = self.config["exclude_patterns"]
+        if not isinstance(exclude_patterns, list):
             raise ConfigError("exclude_patterns must be a list")
+        if not all(isinstance(pattern, str) for pattern in exclude_patterns):
+            raise ConfigError("exclude_patterns must be a list of strings")
 
         # Validate timeout_seconds
         if (
@@ -219,6 +342,16 @@ class Config:
         ):
             raise ConfigError("timeout_seconds must be a positive integer")
 
+        # Validate min_fetch_interval_seconds
+        interval = self.config["min_fetch_interval_seconds"]
+        if not isinstance(interval, int) or interval < 0:
+            raise ConfigError("min_fetch_interval_seconds must be a non-negative integer")
+
+        # Validate max_workers (None means size the pool automatically)
+        max_workers = self.config["max_workers"]
+        if max_workers is not None and (not isinstance(max_workers, int) or max_workers < 1):
+            raise ConfigError("max_workers must be a positive integer")
+
         # Validate boolean flags
         for key in ["skip_dirty", "verbose", "quiet", "show_uptodate", "parallel_operations"]:
             if key in self.config and not isinstance(self.config[key], bool):
@@ -5,20 +5,33 @@ This module provides functionality to safely execute Git operations,
 particularly pulling changes from remote repositories.
 """
 
+import os
 import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 from .exceptions import GitNotFoundError
+from .models import MSG_CLEAN, MSG_UNCOMMITTED, MSG_UP_TO_DATE, MSG_UPDATED, StatusSnapshot
+
+# Environment shared by every git call: built once instead of per call.
+# GIT_OPTIONAL_LOCKS=0 (same as --no-optional-locks) stops read-only commands
+# like status from taking the index lock, and the C locale keeps git's
+# output in English for the checks that still read it.
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "LC_ALL": "C", "LANG": "C"}
 
 
 class GitOperations:
     """Handles Git operations on repositories."""
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def check_git_available() -> bool:
         """
         Check if Git is installed and available in PATH.
 
+        The result is cached, so `git --version` runs at most once per process.
+
         Returns:
             True if Git is available, False otherwise
         """
@@ -27,6 +40,7 @@ class GitOperations:
                 ["git", "--version"],
                 capture_output=True,
                 text=True,
+                env=_GIT_ENV,
                 timeout=5,
             )
             return result.returncode == 0
@@ -66,6 +80,7 @@ class GitOperations:
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
+                env=_GIT_ENV,
                 timeout=timeout,
             )
 
@@ -74,9 +89,9 @@ class GitOperations:
                 output = result.stdout.strip()
                 # Check if already up to date
                 if "Already up to date" in output or "Already up-to-date" in output:
-                    return True, "Already up to date"
+                    return True, MSG_UP_TO_DATE
                 else:
-                    return True, "Successfully updated"
+                    return True, MSG_UPDATED
             else:
                 error_msg = result.stderr.strip() or result.stdout.strip()
                 return False, error_msg
@@ -106,6 +121,7 @@ class GitOperations:
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
+                env=_GIT_ENV,
                 timeout=5,
             )
 
@@ -114,15 +130,156 @@ class GitOperations:
 
             # If output is empty, repository is clean
             if not result.stdout.strip():
-                return True, "Clean"
+                return True, MSG_CLEAN
             else:
-                return False, "Uncommitted changes"
+                return False, MSG_UNCOMMITTED
 
         except subprocess.TimeoutExpired:
             return False, "Timeout checking status"
         except subprocess.SubprocessError:
             return False, "Error checking status"
 
+    @staticmethod
+    def get_full_status(repo_path: Path) -> StatusSnapshot:
+        """
+        Get working tree and branch information with a single git call.
+
+        Parses ``git status --porcelain=v2 --branch``, whose header lines give
+        the current branch and upstream and whose entry lines mean changes.
+
+        Args:
+            repo_path: Path to the Git repository
+
+        Returns:
+            StatusSnapshot with cleanliness, branch and upstream
+        """
+        try:
+            result = subprocess.run(
+                ["git", "status", "--porcelain=v2", "--branch"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                env=_GIT_ENV,
+                timeout=5,
+            )
+        except subprocess.TimeoutExpired:
+            return StatusSnapshot(is_clean=False, message="Timeout checking status")
+        except (subprocess.SubprocessError, OSError):
+            # OSError covers a repository moved or deleted after it was scanned
+            return StatusSnapshot(is_clean=False, message="Error checking status")
+
+        if result.returncode != 0:
+            return StatusSnapshot(is_clean=False, message="Unable to get status")
+
+        head = None
+        branch = None
+        upstream = None
+        is_clean = True
+
+        for line in result.stdout.splitlines():
+            if line.startswith("# branch.oid "):
+                oid = line[len("# branch.oid ") :]
+                # A repository without commits reports "(initial)"
+                head = None if oid == "(initial)" else oid
+            elif line.startswith("# branch.head "):
+                branch = line[len("# branch.head ") :]
+            elif line.startswith("# branch.upstream "):
+                upstream = line[len("# branch.upstream ") :]
+            elif line and not line.startswith("#"):
+                is_clean = False
+
+        message = MSG_CLEAN if is_clean else MSG_UNCOMMITTED
+        return StatusSnapshot(
+            is_clean=is_clean, message=message, branch=branch, upstream=upstream, head=head
+        )
+
+    @staticmethod
+    def count_new_commits(repo_path: Path, old_head: str) -> Optional[int]:
+        """
+        Count commits on the upstream branch that were not reachable from old_head.
+
+        Used after a pull to tell an update from a no-op without parsing
+        git's (localized) output. Counting against the upstream rather than
+        HEAD leaves out local commits that a rebasing pull rewrote on top.
+
+        Args:
+            repo_path: Path to the Git repository
+            old_head: Commit HEAD pointed to before the pull
+
+        Returns:
+            Number of new commits, or None if it couldn't be determined
+        """
+        try:
+            result = subprocess.run(
+                ["git", "rev-list", "--count", f"{old_head}..@{{upstream}}"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                env=_GIT_ENV,
+                timeout=5,
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        try:
+            return int(result.stdout.strip())
+        except ValueError:
+            return None
+
+    @staticmethod
+    def get_git_dir(repo_path: Path) -> Path:
+        """
+        Get the Git directory of a repository.
+
+        Handles worktrees and submodules, where ``.git`` is a file containing
+        ``gitdir: <path>`` instead of a directory.
+
+        Args:
+            repo_path: Path to the Git repository
+
+        Returns:
+            Path to the repository's Git directory
+        """
+        git_path = repo_path / ".git"
+        if not git_path.is_file():
+            return git_path
+
+        try:
+            content = git_path.read_text().strip()
+        except OSError:
+            return git_path
+
+        if not content.startswith("gitdir:"):
+            return git_path
+
+        git_dir = Path(content[len("gitdir:") :].strip())
+        if not git_dir.is_absolute():
+            git_dir = repo_path / git_dir
+        return git_dir
+
+    @staticmethod
+    def seconds_since_fetch(repo_path: Path) -> Optional[float]:
+        """
+        Get how long ago the repository was last fetched.
+
+        Uses the modification time of ``FETCH_HEAD``, which Git rewrites on
+        every fetch or pull, so no git process is started.
+
+        Args:
+            repo_path: Path to the Git repository
+
+        Returns:
+            Seconds since the last fetch, or None if it has never been fetched
+        """
+        fetch_head = GitOperations.get_git_dir(repo_path) / "FETCH_HEAD"
+        try:
+            return time.time() - fetch_head.stat().st_mtime
+        except OSError:
+            return None
+
     @staticmethod
     def has_upstream(repo_path: Path) -> bool:
         """
@@ -140,6 +297,7 @@ class GitOperations:
                 cwd=repo_path,
                 capture_output=True,
                 text=True,
+                env=_GIT_ENV,
                 timeout=5,
             )
             return result.returncode == 0
@@ -4,11 +4,90 @@ Logging system for Gitty Up.
 Provides file-based logging with rotation for debugging and audit trails.
 """
 
+import atexit
 import logging
 import os
+import time
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import Any, Dict, Optional
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once."""
+
+    def __init__(self, fmt: str, datefmt: str) -> None:
+        super().__init__(fmt, datefmt=datefmt)
+        self._cached_time = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record's time, reusing the last result within the same second."""
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.datefmt, self.converter(second))
+            # Store both together so concurrent emits never see a mismatched pair
+            self._cached_time = (second, formatted)
+        return formatted
+
+
+# Every log file uses the same format, so all handlers share one formatter
+_LOG_FORMATTER = _CachedTimeFormatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# One rotating handler per log file for the whole process, so creating another
+# GittyUpLogger reuses the open file instead of re-creating directories and reopening it
+_file_handlers: Dict[Path, RotatingFileHandler] = {}
+
+
+def _get_file_handler(log_dir: Path) -> RotatingFileHandler:
+    """
+    Get the shared rotating file handler for a log directory, creating it once.
+
+    Args:
+        log_dir: Directory to store log files
+
+    Returns:
+        Rotating file handler writing to gittyup.log in log_dir
+    """
+    log_file = log_dir / "gittyup.log"
+    handler = _file_handlers.get(log_file)
+    if handler is not None:
+        return handler
+
+    # Create log directory if it doesn't exist
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    # Set up file handler with rotation
+    handler = RotatingFileHandler(
+        log_file,
+        maxBytes=10 * 1024 * 1024,  # 10 MB
+        backupCount=10,  # Keep last 10 log files
+    )
+    handler.setLevel(logging.DEBUG)
+    handler.setFormatter(_LOG_FORMATTER)
+
+    _file_handlers[log_file] = handler
+    return handler
+
+
+def close_file_handlers() -> None:
+    """
+    Flush and close every shared file handler and forget it.
+
+    Registered with atexit; tests also call it so loggers created over many
+    temporary directories don't each keep a log file open.
+    """
+    logger = logging.getLogger("gittyup")
+    for handler in _file_handlers.values():
+        logger.removeHandler(handler)
+        handler.close()
+    _file_handlers.clear()
+
+
+atexit.register(close_file_handlers)
 
 
 class GittyUpLogger:
@@ -37,27 +116,8 @@ class GittyUpLogger:
         if log_dir is None:
             log_dir = self._get_default_log_dir()
 
-        # Create log directory if it doesn't exist
-        log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Set up file handler with rotation
-        log_file = log_dir / "gittyup.log"
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=10 * 1024 * 1024,  # 10 MB
-            backupCount=10,  # Keep last 10 log files
-        )
-        file_handler.setLevel(logging.DEBUG)
-
-        # Set up formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        file_handler.setFormatter(formatter)
-
-        # Add handler to logger
-        self.logger.addHandler(file_handler)
+        # Add the shared file handler to logger
+        self.logger.addHandler(_get_file_handler(log_dir))
 
         # Log initialization
         self.info("Gitty Up logger initialized")
@@ -86,62 +146,61 @@ class GittyUpLogger:
 
         return log_dir
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any) -> None:
         """Log a debug message."""
-        if self.enabled:
-            self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Log an info message."""
-        if self.enabled:
-            self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Log a warning message."""
-        if self.enabled:
-            self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Log an error message."""
-        if self.enabled:
-            self.logger.error(message)
+        self.logger.error(message, *args)
 
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args: Any) -> None:
         """Log an exception with traceback."""
-        if self.enabled:
-            self.logger.exception(message)
+        self.logger.exception(message, *args)
 
-    def log_scan_start(self, path: str, max_depth: int) -> None:
+    def log_scan_start(self, path: str, max_depth: Optional[int]) -> None:
         """Log the start of a repository scan."""
-        self.info(f"Starting scan: path={path}, max_depth={max_depth}")
+        self.info("Starting scan: path=%s, max_depth=%s", path, max_depth)
 
     def log_scan_complete(self, repo_count: int, duration: float) -> None:
         """Log the completion of a repository scan."""
-        self.info(f"Scan complete: {repo_count} repositories found in {duration:.2f}s")
+        self.info("Scan complete: %d repositories found in %.2fs", repo_count, duration)
 
     def log_repo_update_start(self, repo_path: str) -> None:
         """Log the start of a repository update."""
-        self.debug(f"Updating repository: {repo_path}")
+        self.debug("Updating repository: %s", repo_path)
 
     def log_repo_update_success(self, repo_path: str, message: str) -> None:
         """Log a successful repository update."""
-        self.info(f"Update successful: {repo_path} - {message}")
+        self.info("Update successful: %s - %s", repo_path, message)
 
     def log_repo_update_skip(self, repo_path: str, reason: str) -> None:
         """Log a skipped repository update."""
-        self.info(f"Update skipped: {repo_path} - {reason}")
+        self.info("Update skipped: %s - %s", repo_path, reason)
 
     def log_repo_update_error(self, repo_path: str, error: str) -> None:
         """Log a failed repository update."""
-        self.error(f"Update failed: {repo_path} - {error}")
+        self.error("Update failed: %s - %s", repo_path, error)
 
     def log_operation_summary(
         self, total: int, updated: int, skipped: int, errors: int, duration: float
     ) -> None:
         """Log the summary of all operations."""
         self.info(
-            f"Operation complete: total={total}, updated={updated}, "
-            f"skipped={skipped}, errors={errors}, duration={duration:.2f}s"
+            "Operation complete: total=%d, updated=%d, skipped=%d, errors=%d, duration=%.2fs",
+            total,
+            updated,
+            skipped,
+            errors,
+            duration,
         )
 
     def get_log_file_path(self) -> Optional[Path]:
@@ -0,0 +1,106 @@
+"""
+Data models for Gitty Up.
+
+Defines the result types produced while processing repositories so that
+per-repository work can run independently of output and summary handling.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Messages shared by every repository result, so equal outcomes share one string
+MSG_UP_TO_DATE = "Already up to date"
+MSG_UPDATED = "Successfully updated"
+MSG_CLEAN = "Clean"
+MSG_UNCOMMITTED = "Uncommitted changes"
+MSG_NO_UPSTREAM = "No upstream configured"
+MSG_FETCHED_RECENTLY = "Fetched recently"
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class RepoState(str, Enum):
+    """Outcome of processing a single repository."""
+
+    SUCCESS = "success"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    DRY_RUN = "dry_run"
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class StatusSnapshot:
+    """Working tree and branch state of a repository from a single git status call."""
+
+    is_clean: bool
+    message: str
+    branch: Optional[str] = None
+    upstream: Optional[str] = None
+    head: Optional[str] = None
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class RepoStatus:
+    """Result of processing a single repository."""
+
+    path: Path
+    state: RepoState
+    message: str = ""
+    commits_pulled: Optional[int] = None
+
+    @property
+    def already_up_to_date(self) -> bool:
+        """Whether a pull brought in no new commits."""
+        return self.commits_pulled == 0
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class SummaryStats:
+    """Aggregated results for a whole run."""
+
+    updated: int = 0
+    skipped: int = 0
+    errors: int = 0
+    results: List[RepoStatus] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Number of repositories processed."""
+        return len(self.results)
+
+    def add_result(self, result: RepoStatus) -> None:
+        """
+        Record a repository result and update the counters.
+
+        Args:
+            result: Result of processing a repository
+        """
+        self.results.append(result)
+
+        handler = _RESULT_HANDLERS.get(result.state)
+        if handler is not None:
+            handler(self)
+
+
+def _count_updated(stats: SummaryStats) -> None:
+    stats.updated += 1
+
+
+def _count_skipped(stats: SummaryStats) -> None:
+    stats.skipped += 1
+
+
+def _count_error(stats: SummaryStats) -> None:
+    stats.errors += 1
+
+
+# Counter to bump for each state; states not listed (dry run) are only recorded
+_RESULT_HANDLERS: Dict[RepoState, Callable[[SummaryStats], None]] = {
+    RepoState.SUCCESS: _count_updated,
+    RepoState.SKIPPED: _count_skipped,
+    RepoState.FAILED: _count_error,
+}
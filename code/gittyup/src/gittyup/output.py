@@ -5,25 +5,107 @@ This module provides colored and formatted output for the CLI,
 making it easy to understand the status of operations.
 """
 
-from pathlib import Path
+import sys
+from typing import Any
 import colorama
 from colorama import Fore, Style
 
-# Initialize colorama for cross-platform colored output
-colorama.init(autoreset=True)
+# Set once colorama has enabled ANSI handling on the Windows console
+_colorama_initialized = False
+
+# Whether stdout was a terminal when colors were initialized
+_is_terminal = False
+
+
+class _PlainPalette:
+    """Stand-in for colorama's Fore and Style that yields no escape codes."""
+
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+
+# Active palette, bound once by _init_colors so print calls never branch on no_color
+_fore = Fore
+_style = Style
+
+
+def _set_palette(fore: Any, style: Any) -> None:
+    """Bind the palette and rebuild the templates derived from it."""
+    global _fore, _style, _SUCCESS_TEMPLATE, _WARNING_TEMPLATE, _ERROR_TEMPLATE
+    global _SKIPPED_TEMPLATE, _SUMMARY_ROWS
+
+    _fore = fore
+    _style = style
+
+    # Per-repository line templates taking (repo name, message), built once
+    # instead of composing an f-string on every print
+    reset = style.RESET_ALL
+    _SUCCESS_TEMPLATE = f"{fore.GREEN}✓ {style.BRIGHT}{{:<30}}{reset} {{}}\n"
+    _WARNING_TEMPLATE = f"{fore.YELLOW}⚠ {style.BRIGHT}{{:<30}}{reset} {{}}\n"
+    _ERROR_TEMPLATE = f"{fore.RED}✗ {style.BRIGHT}{{:<30}}{reset} {{}}\n"
+    _SKIPPED_TEMPLATE = f"{fore.LIGHTBLACK_EX}○ {style.BRIGHT}{{:<30}}{reset} Skipped: {{}}\n"
+
+    # Summary rows as (color, label), in the order updated, skipped, errors
+    _SUMMARY_ROWS = (
+        (fore.GREEN, "✓ Updated"),
+        (fore.YELLOW, "○ Skipped"),
+        (fore.RED, "✗ Errors"),
+    )
+
+
+_set_palette(Fore, Style)
+
+
+def _init_colors(no_color: bool = False) -> None:
+    """
+    Enable ANSI colors on the console (only once) and bind the output palette.
+
+    Colors are used only when stdout is a terminal, so redirected output stays
+    free of escape codes without a stream wrapper filtering every write.
+
+    Args:
+        no_color: Emit plain text without ANSI escape codes
+    """
+    global _colorama_initialized, _is_terminal
+    _is_terminal = sys.stdout.isatty()
+    if no_color or not _is_terminal:
+        _set_palette(_PlainPalette(), _PlainPalette())
+    else:
+        _set_palette(Fore, Style)
+
+    if _colorama_initialized:
+        return
+
+    # Turns on native ANSI support on Windows 10+ consoles (wrapping stdout only on
+    # older ones) and does nothing elsewhere, unlike colorama.init() which wraps
+    # stdout everywhere and parses every write
+    colorama.just_fix_windows_console()
+    _colorama_initialized = True
 
 
 class OutputFormatter:
     """Handles formatted console output with colors."""
 
+    def __init__(self, no_color: bool = False) -> None:
+        """
+        Initialize the output formatter.
+
+        Args:
+            no_color: Disable colored output
+        """
+        _init_colors(no_color)
+
     @staticmethod
     def print_banner() -> None:
-        """Print the application banner."""
+        """Print the application banner (skipped when output is redirected)."""
+        if not _is_terminal:
+            return
+
         banner = f"""
-{Fore.CYAN}{Style.BRIGHT}╔═══════════════════════════════════════╗
+{_fore.CYAN}{_style.BRIGHT}╔═══════════════════════════════════════╗
 ║           🚀 Gitty Up 🚀             ║
 ║   Keeping Your Repos Up to Date      ║
-╚═══════════════════════════════════════╝{Style.RESET_ALL}
+╚═══════════════════════════════════════╝{_style.RESET_ALL}
 """
         print(banner)
 
@@ -31,77 +113,96 @@ class OutputFormatter:
     def print_scanning(path: str) -> None:
         """Print scanning message."""
         print(
-            f"\n{Fore.BLUE}🔍 Scanning for repositories in: {Style.BRIGHT}{path}{Style.RESET_ALL}"
+            f"\n{_fore.BLUE}🔍 Scanning for repositories in: "
+            f"{_style.BRIGHT}{path}{_style.RESET_ALL}"
         )
 
+    @staticmethod
+    def format_found_repos(count: int) -> str:
+        """Return the line reporting how many repositories were found."""
+        if count == 0:
+            return f"{_fore.YELLOW}⚠️  No repositories found{_style.RESET_ALL}"
+        if count == 1:
+            return f"{_fore.GREEN}✓ Found 1 repository{_style.RESET_ALL}"
+        return f"{_fore.GREEN}✓ Found {count} repositories{_style.RESET_ALL}"
+
     @staticmethod
     def print_found_repos(count: int) -> None:
         """Print number of repositories found."""
-        if count == 0:
-            print(f"{Fore.YELLOW}⚠️  No repositories found{Style.RESET_ALL}")
-        elif count == 1:
-            print(f"{Fore.GREEN}✓ Found 1 repository{Style.RESET_ALL}")
-        else:
-            print(f"{Fore.GREEN}✓ Found {count} repositories{Style.RESET_ALL}")
+        print(OutputFormatter.format_found_repos(count))
+
+    @staticmethod
+    def format_scan_complete(count: int) -> str:
+        """Return the line reporting how many repositories a finished scan found."""
+        noun = "repository" if count == 1 else "repositories"
+        return f"{_fore.GREEN}✓ Scan complete: {count} {noun} found{_style.RESET_ALL}"
+
+    @staticmethod
+    def print_scan_complete(count: int) -> None:
+        """Print number of repositories found once a scan running alongside updates ends."""
+        print(OutputFormatter.format_scan_complete(count))
 
     @staticmethod
     def print_updating() -> None:
         """Print updating message."""
-        print(f"\n{Fore.BLUE}📥 Updating repositories...{Style.RESET_ALL}\n")
+        print(f"\n{_fore.BLUE}📥 Updating repositories...{_style.RESET_ALL}\n")
 
     @staticmethod
-    def print_success(repo_path: Path, message: str) -> None:
+    def print_success(repo_name: str, message: str) -> None:
         """Print success message for a repository."""
-        repo_name = repo_path.name
-        print(f"{Fore.GREEN}✓ {Style.BRIGHT}{repo_name:<30}{Style.RESET_ALL} {message}")
+        sys.stdout.write(_SUCCESS_TEMPLATE.format(repo_name, message))
 
     @staticmethod
-    def print_warning(repo_path: Path, message: str) -> None:
+    def print_warning(repo_name: str, message: str) -> None:
         """Print warning message for a repository."""
-        repo_name = repo_path.name
-        print(f"{Fore.YELLOW}⚠ {Style.BRIGHT}{repo_name:<30}{Style.RESET_ALL} {message}")
+        sys.stdout.write(_WARNING_TEMPLATE.format(repo_name, message))
 
     @staticmethod
-    def print_error(repo_path: Path, message: str) -> None:
+    def print_error(repo_name: str, message: str) -> None:
         """Print error message for a repository."""
-        repo_name = repo_path.name
-        print(f"{Fore.RED}✗ {Style.BRIGHT}{repo_name:<30}{Style.RESET_ALL} {message}")
+        sys.stdout.write(_ERROR_TEMPLATE.format(repo_name, message))
 
     @staticmethod
-    def print_skipped(repo_path: Path, reason: str) -> None:
+    def print_skipped(repo_name: str, reason: str) -> None:
         """Print skipped message for a repository."""
-        repo_name = repo_path.name
-        print(
-            f"{Fore.LIGHTBLACK_EX}○ {Style.BRIGHT}{repo_name:<30}{Style.RESET_ALL} Skipped: {reason}"
-        )
+        sys.stdout.write(_SKIPPED_TEMPLATE.format(repo_name, reason))
+
+    @staticmethod
+    def format_summary(
+        total: int, updated: int, skipped: int, errors: int, elapsed_time: float
+    ) -> str:
+        """Return the summary block, ending with a newline."""
+        lines = [
+            f"\n{_fore.CYAN}{'=' * 60}{_style.RESET_ALL}",
+            f"{_fore.CYAN}{_style.BRIGHT}Summary:{_style.RESET_ALL}",
+            f"  Total repositories: {total}",
+        ]
+
+        for (color, label), count in zip(_SUMMARY_ROWS, (updated, skipped, errors)):
+            if count > 0:
+                lines.append(f"  {color}{label}: {count}{_style.RESET_ALL}")
+
+        lines.append(f"  ⏱️  Time elapsed: {elapsed_time:.2f}s")
+        lines.append(f"{_fore.CYAN}{'=' * 60}{_style.RESET_ALL}\n")
+        return "\n".join(lines) + "\n"
 
     @staticmethod
     def print_summary(
         total: int, updated: int, skipped: int, errors: int, elapsed_time: float
     ) -> None:
         """Print summary of operations."""
-        print(f"\n{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{Style.BRIGHT}Summary:{Style.RESET_ALL}")
-        print(f"  Total repositories: {total}")
-
-        if updated > 0:
-            print(f"  {Fore.GREEN}✓ Updated: {updated}{Style.RESET_ALL}")
-
-        if skipped > 0:
-            print(f"  {Fore.YELLOW}○ Skipped: {skipped}{Style.RESET_ALL}")
-
-        if errors > 0:
-            print(f"  {Fore.RED}✗ Errors: {errors}{Style.RESET_ALL}")
-
-        print(f"  ⏱️  Time elapsed: {elapsed_time:.2f}s")
-        print(f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}\n")
+        # The whole block goes out in one write
+        sys.stdout.write(
+            OutputFormatter.format_summary(total, updated, skipped, errors, elapsed_time)
+        )
+        sys.stdout.flush()
 
     @staticmethod
     def print_error_message(message: str) -> None:
         """Print a general error message."""
-        print(f"\n{Fore.RED}{Style.BRIGHT}ERROR:{Style.RESET_ALL} {message}\n")
+        print(f"\n{_fore.RED}{_style.BRIGHT}ERROR:{_style.RESET_ALL} {message}\n")
 
     @staticmethod
     def print_info(message: str) -> None:
         """Print an informational message."""
-        print(f"{Fore.BLUE}ℹ️  {message}{Style.RESET_ALL}")
+        print(f"{_fore.BLUE}ℹ️  {message}{_style.RESET_ALL}")
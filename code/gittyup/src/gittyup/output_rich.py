@@ -4,13 +4,29 @@ Enhanced output formatting with Rich library.
 Provides progress bars, tables, and beautiful formatting.
 """
 
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
+from .models import RepoState, RepoStatus
+
+# Summary rows as (color, label), in the order updated, skipped, errors
+_SUMMARY_ROWS = (
+    ("green", "✓ Updated"),
+    ("yellow", "○ Skipped"),
+    ("red", "✗ Errors"),
+)
+
+# Symbol and style of each state in the batched results table
+_RESULT_STYLES = {
+    RepoState.SUCCESS: ("✓", "green"),
+    RepoState.SKIPPED: ("○", "dim"),
+    RepoState.FAILED: ("✗", "red"),
+}
 
 
 class RichOutputFormatter:
@@ -27,10 +43,17 @@ class RichOutputFormatter:
         self.console = Console()
         self.verbose = verbose
         self.quiet = quiet
+        self._is_tty = self.console.is_terminal
+
+        # Styled per-repository prefixes, built once so the hot path skips markup parsing
+        self._success_prefix = Text.assemble(("✓", "green"), " ")
+        self._warning_prefix = Text.assemble(("⚠", "yellow"), " ")
+        self._error_prefix = Text.assemble(("✗", "red"), " ")
+        self._skipped_prefix = Text.assemble(("○", "dim"), " ")
 
     def print_banner(self) -> None:
-        """Print the application banner."""
-        if self.quiet:
+        """Print the application banner (skipped when output is redirected)."""
+        if self.quiet or not self._is_tty:
             return
 
         banner = Panel.fit(
@@ -59,6 +82,12 @@ class RichOutputFormatter:
         else:
             self.console.print(f"[green]✓ Found {count} repositories[/green]")
 
+    def print_scan_complete(self, count: int) -> None:
+        """Print number of repositories found once a scan running alongside updates ends."""
+        if not self.quiet:
+            noun = "repository" if count == 1 else "repositories"
+            self.console.print(f"[green]✓ Scan complete: {count} {noun} found[/green]")
+
     def print_updating(self) -> None:
         """Print updating message."""
         if not self.quiet:
@@ -68,6 +97,9 @@ class RichOutputFormatter:
         """
         Create a progress bar for repository updates.
 
+        When output is redirected the progress bar is disabled, so no refresh
+        thread runs and no cursor control codes are written to logs.
+
         Returns:
             Progress instance
         """
@@ -78,39 +110,77 @@ class RichOutputFormatter:
             TaskProgressColumn(),
             console=self.console,
             transient=False,
+            disable=not self._is_tty,
         )
 
-    def print_success(self, repo_path: Path, message: str, verbose: bool = False) -> None:
+    def _print_repo_line(self, prefix: Text, repo_name: str, message: str) -> None:
+        """Print a styled status line for a repository without markup parsing."""
+        line = prefix.copy()
+        line.append(f"{repo_name:30}", style="bold")
+        line.append(" ")
+        line.append(message)
+        self.console.print(line, markup=False, highlight=False)
+
+    def print_success(self, repo_name: str, message: str, verbose: bool = False) -> None:
         """Print success message for a repository."""
         if self.quiet and not verbose:
             return
 
-        repo_name = repo_path.name
-        if self.verbose or verbose:
-            self.console.print(f"[green]✓[/green] [bold]{repo_name:30}[/bold] {message}")
-        else:
-            self.console.print(f"[green]✓[/green] [bold]{repo_name:30}[/bold] {message}")
+        self._print_repo_line(self._success_prefix, repo_name, message)
 
-    def print_warning(self, repo_path: Path, message: str) -> None:
+    def print_warning(self, repo_name: str, message: str) -> None:
         """Print warning message for a repository."""
         if self.quiet:
             return
 
-        repo_name = repo_path.name
-        self.console.print(f"[yellow]⚠[/yellow] [bold]{repo_name:30}[/bold] {message}")
+        self._print_repo_line(self._warning_prefix, repo_name, message)
 
-    def print_error(self, repo_path: Path, message: str) -> None:
+    def print_error(self, repo_name: str, message: str) -> None:
         """Print error message for a repository (always shown)."""
-        repo_name = repo_path.name
-        self.console.print(f"[red]✗[/red] [bold]{repo_name:30}[/bold] {message}")
+        self._print_repo_line(self._error_prefix, repo_name, message)
 
-    def print_skipped(self, repo_path: Path, reason: str) -> None:
+    def print_skipped(self, repo_name: str, reason: str) -> None:
         """Print skipped message for a repository."""
         if self.quiet:
             return
 
-        repo_name = repo_path.name
-        self.console.print(f"[dim]○[/dim] [bold]{repo_name:30}[/bold] Skipped: {reason}")
+        self._print_repo_line(self._skipped_prefix, repo_name, f"Skipped: {reason}")
+
+    def print_results_table(self, results: List[RepoStatus], show_uptodate: bool = True) -> None:
+        """
+        Print all repository results as one table.
+
+        Used instead of per-repository lines when output is not streamed, so the
+        whole block is rendered with a single console write. Rows follow the
+        same visibility rules as the print_* methods.
+
+        Args:
+            results: Results of processing each repository
+            show_uptodate: Include repositories that were already up to date
+        """
+        table = Table(box=box.SIMPLE, show_header=True, header_style="bold")
+        table.add_column("", no_wrap=True)
+        table.add_column("Repository", style="bold", no_wrap=True)
+        table.add_column("Status", overflow="fold")
+
+        for result in results:
+            state = result.state
+            if state is RepoState.FAILED:
+                message = result.message
+            elif self.quiet or state is RepoState.DRY_RUN:
+                continue
+            elif state is RepoState.SKIPPED:
+                message = f"Skipped: {result.message}"
+            elif show_uptodate or not result.already_up_to_date:
+                message = result.message
+            else:
+                continue
+
+            symbol, style = _RESULT_STYLES[state]
+            table.add_row(Text(symbol, style=style), result.path.name, Text(message))
+
+        if table.row_count:
+            self.console.print(table)
 
     def print_summary_table(
         self,
@@ -127,14 +197,9 @@ class RichOutputFormatter:
 
         table.add_row("Total repositories", str(total))
 
-        if updated > 0:
-            table.add_row("[green]✓ Updated[/green]", f"[green]{updated}[/green]")
-
-        if skipped > 0:
-            table.add_row("[yellow]○ Skipped[/yellow]", f"[yellow]{skipped}[/yellow]")
-
-        if errors > 0:
-            table.add_row("[red]✗ Errors[/red]", f"[red]{errors}[/red]")
+        for (color, label), count in zip(_SUMMARY_ROWS, (updated, skipped, errors)):
+            if count > 0:
+                table.add_row(f"[{color}]{label}[/{color}]", f"[{color}]{count}[/{color}]")
 
         table.add_row("⏱️  Time elapsed", f"{elapsed_time:.2f}s")
 
@@ -5,10 +5,69 @@ This module provides functionality to traverse directory trees and identify
 all Git repositories within them.
 """
 
+import fnmatch
+import os
+import re
+import stat
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Set
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
 from .exceptions import ScanError
 
+# Characters that make an exclude pattern a glob rather than a plain name
+_GLOB_CHARS = frozenset("*?[")
+
+# Common directories that never contain repositories worth updating
+_DEFAULT_EXCLUDES = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        ".venv",
+        "venv",
+        ".tox",
+        "build",
+        "dist",
+    }
+)
+
+
+def compile_exclude_patterns(
+    patterns: Iterable[str],
+) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+    """
+    Split exclude patterns into exact names and one compiled glob regex.
+
+    Plain names are checked with a set lookup; only patterns containing glob
+    characters (like "old-*") go through the regex.
+
+    Args:
+        patterns: Directory names or glob patterns to exclude
+
+    Returns:
+        Tuple of (exact names, compiled regex for globs or None if there are none)
+
+    Raises:
+        ScanError: If a pattern is not a string
+    """
+    names: Set[str] = set()
+    globs: Set[str] = set()
+    for pattern in patterns:
+        if not isinstance(pattern, str):
+            raise ScanError(f"Exclude patterns must be strings, got {pattern!r}")
+        if _GLOB_CHARS.isdisjoint(pattern):
+            # Interned so every scanner shares one copy of each name
+            names.add(sys.intern(pattern))
+        else:
+            globs.add(pattern)
+
+    regex = (
+        re.compile("|".join(fnmatch.translate(glob) for glob in sorted(globs))) if globs else None
+    )
+    return frozenset(names), regex
+
 
 class RepositoryScanner:
     """Scans directories to find Git repositories."""
@@ -18,6 +77,7 @@ class RepositoryScanner:
         root_path: str,
         max_depth: int = 10,
         exclude_patterns: List[str] | None = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the repository scanner.
@@ -26,101 +86,206 @@ class RepositoryScanner:
             root_path: Root directory to start scanning from
             max_depth: Maximum directory depth to traverse
             exclude_patterns: List of directory names to exclude from scanning
+            max_workers: Number of threads used to scan subtrees in parallel.
+                        If None, uses min(32, 4 * CPU count) since the threads
+                        mostly wait on filesystem calls.
         """
         self.root_path = Path(root_path).resolve()
         self.max_depth = max_depth
-        self.exclude_patterns: Set[str] = set(exclude_patterns or [])
-
-        # Add common patterns to exclude by default
-        default_excludes = {
-            "node_modules",
-            "__pycache__",
-            ".venv",
-            "venv",
-            ".tox",
-            "build",
-            "dist",
-        }
-        self.exclude_patterns.update(default_excludes)
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.exclude_patterns: FrozenSet[str] = _DEFAULT_EXCLUDES.union(exclude_patterns or ())
+
+        # Plain names are a set lookup; globs like "old-*" share one regex
+        self._exclude_names, self._exclude_re = compile_exclude_patterns(self.exclude_patterns)
 
     def scan(self) -> List[Path]:
         """
         Scan for Git repositories.
 
         Returns:
-            List of paths to Git repositories found
+            Sorted list of paths to Git repositories found
 
         Raises:
             ScanError: If there's an error during scanning
         """
-        if not self.root_path.exists():
+        return sorted(self.iter_repositories())
+
+    def iter_repositories(self) -> Iterator[Path]:
+        """
+        Scan for Git repositories, yielding them as they are found.
+
+        Repositories come in sorted order, the same as scan(), but each one is
+        yielded as soon as everything before it is known, so callers can start
+        working on them while the rest of the tree is still being scanned.
+
+        Yields:
+            Path to each Git repository found
+
+        Raises:
+            ScanError: If there's an error during scanning
+        """
+        # One stat answers both checks
+        try:
+            root_mode = os.stat(self.root_path).st_mode
+        except PermissionError as e:
+            raise ScanError(f"Permission denied: {e}")
+        except FileNotFoundError:
             raise ScanError(f"Path does not exist: {self.root_path}")
+        except OSError as e:
+            # Symlink loops, over-long names, I/O errors, ...
+            raise ScanError(f"Cannot access {self.root_path}: {e}")
 
-        if not self.root_path.is_dir():
+        if not stat.S_ISDIR(root_mode):
             raise ScanError(f"Path is not a directory: {self.root_path}")
 
-        repositories: List[Path] = []
-
+        # Paths stay plain strings during the walk; Path objects are only
+        # built for the repositories that are yielded
         try:
-            self._scan_directory(self.root_path, 0, repositories)
+            repository, frontier = self._probe_directory(os.fspath(self.root_path), 0)
+            if repository is not None:
+                yield Path(repository)
+                return
+
+            # Expand the top levels breadth-first until there are enough independent
+            # subtrees to keep every worker busy (a root holding a single "src" or
+            # "projects" directory would otherwise leave one thread doing all the work)
+            expanded: List[str] = []
+            while frontier and len(frontier) < self.max_workers:
+                next_frontier: List[Tuple[str, int]] = []
+                for directory, depth in frontier:
+                    repository, subdirectories = self._probe_directory(directory, depth)
+                    if repository is not None:
+                        expanded.append(repository)
+                    next_frontier.extend(subdirectories)
+                frontier = next_frontier
+
+            # Each remaining subtree is walked iteratively by one worker
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            try:
+                # A subtree's repositories sort right after its root, so visiting
+                # the expanded repositories and subtree roots in path order keeps
+                # the output sorted; each subtree is waited on only when its turn comes
+                slots: List[Tuple[Path, Optional[Future[List[str]]]]] = [
+                    (Path(repository), None) for repository in expanded
+                ]
+                slots.extend(
+                    (Path(directory), executor.submit(self._scan_subtree, directory, depth))
+                    for directory, depth in frontier
+                )
+                slots.sort(key=itemgetter(0))
+                for path, future in slots:
+                    if future is None:
+                        yield path
+                    else:
+                        yield from sorted(map(Path, future.result()))
+            finally:
+                # Stop queued subtrees if the caller stops iterating early
+                executor.shutdown(cancel_futures=True)
         except PermissionError as e:
             raise ScanError(f"Permission denied: {e}")
         except Exception as e:
             raise ScanError(f"Error during scan: {e}")
 
-        return sorted(repositories)
+    def _scan_subtree(self, directory: str, depth: int) -> List[str]:
+        """
+        Find all repositories below a directory using an explicit stack.
+
+        Runs in a worker thread. Walking with a stack instead of recursion
+        avoids a Python frame per directory level.
 
-    def _scan_directory(
-        self, directory: Path, current_depth: int, repositories: List[Path]
-    ) -> None:
+        Args:
+            directory: Root of the subtree to scan
+            depth: Depth of the subtree root in the directory tree
+
+        Returns:
+            List of repository paths found in the subtree
         """
-        Recursively scan a directory for Git repositories.
+        repositories: List[str] = []
+        stack = deque([(directory, depth)])
+
+        # Bind the methods used per directory to locals
+        probe = self._probe_directory
+        pop = stack.pop
+        push = stack.extend
+        found = repositories.append
+
+        while stack:
+            repository, subdirectories = probe(*pop())
+            if repository is not None:
+                found(repository)
+            push(subdirectories)
+
+        return repositories
+
+    def _probe_directory(
+        self, directory: str, current_depth: int
+    ) -> Tuple[Optional[str], List[Tuple[str, int]]]:
+        """
+        Probe a single directory for a Git repository.
+
+        Subdirectories are returned rather than scanned so the caller decides
+        how to walk them.
 
         Args:
-            directory: Directory to scan
+            directory: Directory to probe
             current_depth: Current depth in the directory tree
-            repositories: List to append found repositories to
+
+        Returns:
+            Tuple of (repository path or None, list of (subdirectory, depth) to scan next)
         """
-        if current_depth > self.max_depth:
-            return
+        child_depth = current_depth + 1
+        if child_depth > self.max_depth:
+            # Children won't be scanned, so probe .git directly instead of listing
+            return (directory if self.is_git_repository(directory) else None), []
 
-        # Check if this directory is a Git repository
-        git_dir = directory / ".git"
-        if git_dir.exists() and git_dir.is_dir():
-            repositories.append(directory)
-            # Don't scan inside Git repositories
-            return
+        subdirectories: List[Tuple[str, int]] = []
 
-        # Scan subdirectories
+        # Bind the exclude checks and list append to locals for the per-entry loop
+        exclude_names = self._exclude_names
+        exclude_match = self._exclude_re.match if self._exclude_re is not None else None
+        add_subdirectory = subdirectories.append
+
+        # List the directory once: a .git entry in the listing marks a repository,
+        # so no separate probe is needed for directories that get scanned
         try:
-            for entry in directory.iterdir():
-                # Skip files
-                if not entry.is_dir():
-                    continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name == ".git":
+                        # A .git directory, or a .git file pointing elsewhere
+                        # (worktrees, submodules), marks a repository. Symlinks
+                        # aren't followed, so the entry type comes from the
+                        # listing and this needs no extra stat
+                        if not entry.is_symlink() and (entry.is_dir() or entry.is_file()):
+                            # Don't scan inside Git repositories
+                            return directory, []
+                        continue
+
+                    # Cheap name checks first, so pruned entries never need a stat
+                    # on filesystems that don't report the entry type
 
-                # Skip symbolic links to avoid circular references
-                if entry.is_symlink():
-                    continue
+                    # Skip hidden directories (starting with .)
+                    if name.startswith("."):
+                        continue
 
-                # Skip excluded directories
-                if entry.name in self.exclude_patterns:
-                    continue
+                    # Skip excluded directories
+                    if name in exclude_names or (exclude_match is not None and exclude_match(name)):
+                        continue
 
-                # Skip hidden directories (starting with .)
-                if entry.name.startswith("."):
-                    continue
+                    # Skip files and symbolic links (avoids circular references)
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
 
-                # Recursively scan subdirectory
-                self._scan_directory(entry, current_depth + 1, repositories)
+                    add_subdirectory((entry.path, child_depth))
 
-        except PermissionError:
-            # Skip directories we don't have permission to read
-            pass
         except OSError:
-            # Skip directories with other OS errors
-            pass
+            # Directories we can't list (permissions or other OS errors) can still
+            # be repositories when .git itself is reachable
+            return (directory if self.is_git_repository(directory) else None), []
+
+        return None, subdirectories
 
-    def is_git_repository(self, path: Path) -> bool:
+    def is_git_repository(self, path: Union[str, Path]) -> bool:
         """
         Check if a path is a Git repository.
 
@@ -130,5 +295,11 @@ class RepositoryScanner:
         Returns:
             True if the path is a Git repository, False otherwise
         """
-        git_dir = path / ".git"
-        return git_dir.exists() and git_dir.is_dir()
+        # One stat answers both "exists" and its type: a .git directory, or a
+        # .git file pointing elsewhere (worktrees, submodules). Like the scan
+        # itself, this doesn't follow a symlinked .git
+        try:
+            st = os.lstat(os.path.join(path, ".git"))
+        except OSError:
+            return False
+        return stat.S_ISDIR(st.st_mode) or stat.S_ISREG(st.st_mode)
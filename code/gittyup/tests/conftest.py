@@ -0,0 +1,22 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from gittyup.logger import close_file_handlers
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the parsed-config cache out of the real ~/.cache during tests."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture(autouse=True)
+def _close_log_files():
+    """Close log files opened during a test so each tmp_path doesn't leak a descriptor."""
+    yield
+    close_file_handlers()
@@ -3,9 +3,17 @@ Tests for the CLI module.
 """
 
 from click.testing import CliRunner
+import itertools
+import pytest
+import threading
+import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
-from gittyup.cli import main
-from gittyup.exceptions import GitNotFoundError
+from gittyup import cli
+from gittyup.cli import main, _process_repo, _run_updates
+from gittyup.config import Config
+from gittyup.exceptions import GitNotFoundError, ScanError
+from gittyup.models import MSG_UP_TO_DATE, RepoState, RepoStatus, StatusSnapshot
 
 
 class TestCLI:
@@ -15,6 +23,11 @@ class TestCLI:
         """Set up test fixtures."""
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def _run_in_tmp_path(self, tmp_path, monkeypatch):
+        """Run each command from an empty directory so no local config is picked up."""
+        monkeypatch.chdir(tmp_path)
+
     def test_version_option(self):
         """Test --version flag."""
         result = self.runner.invoke(main, ["--version"])
@@ -28,73 +41,296 @@ class TestCLI:
         assert "Gitty Up" in result.output
         assert "Update all Git repositories" in result.output
 
-    @patch("gittyup.cli.GitOperations.ensure_git_available")
+    @patch.object(cli.GitOperations, "ensure_git_available")
     def test_git_not_available(self, mock_ensure_git):
         """Test behavior when Git is not available."""
         mock_ensure_git.side_effect = GitNotFoundError("Git not found")
 
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["."])
-            assert result.exit_code == 1
-            assert "Git not found" in result.output or "ERROR" in result.output
+        result = self.runner.invoke(main, ["."])
+        assert result.exit_code == 1
+        assert "Git not found" in result.output or "ERROR" in result.output
 
-    @patch("gittyup.cli.GitOperations.ensure_git_available")
-    @patch("gittyup.cli.RepositoryScanner")
+    @patch.object(cli.GitOperations, "ensure_git_available")
+    @patch.object(cli, "RepositoryScanner")
     def test_no_repositories_found(self, mock_scanner, mock_ensure_git):
         """Test behavior when no repositories are found."""
         mock_ensure_git.return_value = None
         mock_scanner_instance = MagicMock()
-        mock_scanner_instance.scan.return_value = []
+        mock_scanner_instance.iter_repositories.return_value = iter([])
         mock_scanner.return_value = mock_scanner_instance
 
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["."])
-            # Should exit successfully when no repos found
-            assert result.exit_code == 0
+        result = self.runner.invoke(main, ["."])
+        # Should exit successfully when no repos found
+        assert result.exit_code == 0
 
-    @patch("gittyup.cli.GitOperations")
-    @patch("gittyup.cli.RepositoryScanner")
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
     def test_dry_run_mode(self, mock_scanner, mock_git_ops):
         """Test --dry-run flag."""
         # Setup mocks
         mock_git_ops.ensure_git_available.return_value = None
         mock_scanner_instance = MagicMock()
-        mock_scanner_instance.scan.return_value = [MagicMock(name="test-repo")]
+        mock_scanner_instance.iter_repositories.return_value = iter([MagicMock(name="test-repo")])
         mock_scanner.return_value = mock_scanner_instance
 
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["--dry-run", "."])
-            assert "DRY RUN" in result.output or "Would " in result.output
+        result = self.runner.invoke(main, ["--dry-run", "."])
+        assert "DRY RUN" in result.output or "Would " in result.output
+        assert "Scan complete: 1 repository found" in result.output
 
-    @patch("gittyup.cli.GitOperations")
-    @patch("gittyup.cli.RepositoryScanner")
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
     def test_verbose_option(self, mock_scanner, mock_git_ops):
         """Test --verbose option."""
         mock_git_ops.ensure_git_available.return_value = None
         mock_scanner_instance = MagicMock()
-        mock_scanner_instance.scan.return_value = []
+        mock_scanner_instance.iter_repositories.return_value = iter([])
         mock_scanner.return_value = mock_scanner_instance
 
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["-v", "."])
-            assert result.exit_code == 0
+        result = self.runner.invoke(main, ["-v", "."])
+        assert result.exit_code == 0
 
-    @patch("gittyup.cli.GitOperations")
-    @patch("gittyup.cli.RepositoryScanner")
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
     def test_quiet_option(self, mock_scanner, mock_git_ops):
         """Test --quiet option."""
         mock_git_ops.ensure_git_available.return_value = None
         mock_scanner_instance = MagicMock()
-        mock_scanner_instance.scan.return_value = []
+        mock_scanner_instance.iter_repositories.return_value = iter([])
         mock_scanner.return_value = mock_scanner_instance
 
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["-q", "."])
-            assert result.exit_code == 0
+        result = self.runner.invoke(main, ["-q", "."])
+        assert result.exit_code == 0
 
     def test_verbose_and_quiet_conflict(self):
         """Test that --verbose and --quiet cannot be used together."""
-        with self.runner.isolated_filesystem():
-            result = self.runner.invoke(main, ["-v", "-q", "."])
-            assert result.exit_code == 1
-            assert "Cannot use both" in result.output or "verbose and quiet" in result.output
+        result = self.runner.invoke(main, ["-v", "-q", "."])
+        assert result.exit_code == 1
+        assert "Cannot use both" in result.output or "verbose and quiet" in result.output
+
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
+    def test_parallel_updates_all_repos(self, mock_scanner, mock_git_ops):
+        """Test --parallel processes every repository and reports the summary."""
+        mock_git_ops.ensure_git_available.return_value = None
+        mock_git_ops.get_full_status.return_value = StatusSnapshot(
+            is_clean=True, message="Clean", branch="main", upstream="origin/main"
+        )
+        mock_git_ops.pull_repository.return_value = (True, "Successfully updated")
+        repos = [Path(f"/tmp/repo{i}") for i in range(5)]
+        mock_scanner_instance = MagicMock()
+        mock_scanner_instance.iter_repositories.return_value = iter(repos)
+        mock_scanner.return_value = mock_scanner_instance
+
+        result = self.runner.invoke(main, ["--parallel", "--no-color", "--no-log", "."])
+        assert result.exit_code == 0
+        assert mock_git_ops.pull_repository.call_count == 5
+        assert "Updated: 5" in result.output
+
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
+    def test_redirected_rich_output_uses_results_table(self, mock_scanner, mock_git_ops):
+        """Test that Rich output to a non-terminal renders one results table."""
+        mock_git_ops.ensure_git_available.return_value = None
+        mock_git_ops.get_full_status.return_value = StatusSnapshot(
+            is_clean=True, message="Clean", branch="main", upstream="origin/main"
+        )
+        mock_git_ops.pull_repository.return_value = (True, "Successfully updated")
+        mock_git_ops.count_new_commits.return_value = 2
+        mock_scanner.return_value.iter_repositories.return_value = iter(
+            [Path("/tmp/alpha"), Path("/tmp/beta")]
+        )
+
+        result = self.runner.invoke(main, ["--no-log", "."])
+        assert result.exit_code == 0
+        assert "Repository" in result.output
+        assert "alpha" in result.output
+        assert "beta" in result.output
+        assert result.output.count("Successfully updated") == 2
+
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
+    def test_failed_pull_exits_with_error(self, mock_scanner, mock_git_ops):
+        """Test that a failed pull is counted and gives a non-zero exit code."""
+        mock_git_ops.ensure_git_available.return_value = None
+        mock_git_ops.get_full_status.return_value = StatusSnapshot(
+            is_clean=True, message="Clean", branch="main", upstream="origin/main"
+        )
+        mock_git_ops.pull_repository.return_value = (False, "fatal: error")
+        mock_scanner_instance = MagicMock()
+        mock_scanner_instance.iter_repositories.return_value = iter([Path("/tmp/broken")])
+        mock_scanner.return_value = mock_scanner_instance
+
+        result = self.runner.invoke(main, ["--no-color", "--no-log", "."])
+        assert result.exit_code == 1
+        assert "Errors: 1" in result.output
+
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
+    def test_skips_dirty_and_no_upstream_repos(self, mock_scanner, mock_git_ops):
+        """Test that dirty repos and repos without upstream are skipped without pulling."""
+        mock_git_ops.ensure_git_available.return_value = None
+        mock_git_ops.get_full_status.side_effect = [
+            StatusSnapshot(is_clean=False, message="Uncommitted changes", upstream="origin/main"),
+            StatusSnapshot(is_clean=True, message="Clean", upstream=None),
+        ]
+        mock_scanner_instance = MagicMock()
+        mock_scanner_instance.iter_repositories.return_value = iter(
+            [Path("/tmp/dirty"), Path("/tmp/local")]
+        )
+        mock_scanner.return_value = mock_scanner_instance
+
+        result = self.runner.invoke(main, ["--no-color", "--no-log", "."])
+        assert result.exit_code == 0
+        assert "Uncommitted changes" in result.output
+        assert "No upstream configured" in result.output
+        mock_git_ops.pull_repository.assert_not_called()
+
+    @patch.object(cli, "GitOperations")
+    @patch.object(cli, "RepositoryScanner")
+    def test_skips_recently_fetched_repos(self, mock_scanner, mock_git_ops):
+        """Test that min_fetch_interval_seconds skips repos without running git."""
+        mock_git_ops.ensure_git_available.return_value = None
+        mock_git_ops.seconds_since_fetch.return_value = 30.0
+        mock_scanner_instance = MagicMock()
+        mock_scanner_instance.iter_repositories.return_value = iter([Path("/tmp/fresh")])
+        mock_scanner.return_value = mock_scanner_instance
+
+        with open("gittyup.yaml", "w") as f:
+            f.write("min_fetch_interval_seconds: 600\n")
+        result = self.runner.invoke(
+            main, ["--config", "gittyup.yaml", "--no-color", "--no-log", "."]
+        )
+        assert result.exit_code == 0
+        assert "Fetched recently" in result.output
+        mock_git_ops.get_full_status.assert_not_called()
+        mock_git_ops.pull_repository.assert_not_called()
+
+
+class TestProcessRepo:
+    """Test suite for classifying a single repository update."""
+
+    @pytest.fixture
+    def git_ops(self):
+        """GitOperations with a clean, tracked repository whose pull succeeds."""
+        with patch.object(cli, "GitOperations") as git_ops:
+            git_ops.get_full_status.return_value = StatusSnapshot(
+                is_clean=True, message="Clean", upstream="origin/main", head="abc123"
+            )
+            git_ops.pull_repository.return_value = (True, "Successfully updated")
+            yield git_ops
+
+    @pytest.mark.parametrize(
+        "count, pull_message, expected_message, expected_commits",
+        [
+            pytest.param(0, "Successfully updated", MSG_UP_TO_DATE, 0, id="no_new_commits"),
+            pytest.param(3, "Successfully updated", "Successfully updated", 3, id="new_commits"),
+            pytest.param(None, MSG_UP_TO_DATE, MSG_UP_TO_DATE, 0, id="unknown_up_to_date"),
+            pytest.param(
+                None, "Successfully updated", "Successfully updated", None, id="unknown_updated"
+            ),
+        ],
+    )
+    def test_commit_count_classifies_pull(
+        self, git_ops, count, pull_message, expected_message, expected_commits
+    ):
+        """Test that the rev-list count decides the message, falling back to the pull's."""
+        git_ops.pull_repository.return_value = (True, pull_message)
+        git_ops.count_new_commits.return_value = count
+
+        result = _process_repo(Path("/tmp/repo"), Config(), dry_run=False)
+
+        git_ops.count_new_commits.assert_called_once_with(Path("/tmp/repo"), "abc123")
+        assert result.state is RepoState.SUCCESS
+        assert result.message == expected_message
+        assert result.commits_pulled == expected_commits
+        assert result.already_up_to_date is (expected_commits == 0)
+
+    def test_missing_head_uses_pull_message(self, git_ops):
+        """Test that a repository without a prior commit skips counting."""
+        git_ops.get_full_status.return_value = StatusSnapshot(
+            is_clean=True, message="Clean", upstream="origin/main", head=None
+        )
+
+        result = _process_repo(Path("/tmp/repo"), Config(), dry_run=False)
+
+        git_ops.count_new_commits.assert_not_called()
+        assert result.message == "Successfully updated"
+        assert result.commits_pulled is None
+        assert result.already_up_to_date is False
+
+
+class TestRunUpdates:
+    """Test suite for the parallel update driver."""
+
+    def _run_with_fake_pulls(self, cfg, repo_count):
+        """Run _run_updates with a sleeping fake and return (results, peak concurrency)."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_process_repo(repo, cfg, dry_run):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return RepoStatus(path=repo, state=RepoState.SUCCESS, message="Successfully updated")
+
+        repos = [Path(f"/tmp/repo{i}") for i in range(repo_count)]
+        with patch.object(cli, "_process_repo", side_effect=fake_process_repo):
+            results = list(_run_updates(repos, cfg, False, MagicMock()))
+        return results, peak
+
+    def test_sequential_without_parallel_operations(self):
+        """Test that repositories are processed one at a time by default."""
+        results, peak = self._run_with_fake_pulls(Config(), 5)
+        assert len(results) == 5
+        assert peak == 1
+
+    def test_explicit_max_workers_is_respected(self):
+        """Test that a configured max_workers caps concurrency."""
+        cfg = Config()
+        cfg.set("parallel_operations", True)
+        cfg.set("max_workers", 2)
+        results, peak = self._run_with_fake_pulls(cfg, 10)
+        assert len(results) == 10
+        assert peak <= 2
+
+    def test_auto_workers_grow_when_io_bound(self):
+        """Test that automatic sizing grows past the initial pool for I/O-bound work."""
+        cfg = Config()
+        cfg.set("parallel_operations", True)
+        results, peak = self._run_with_fake_pulls(cfg, 40)
+        assert len(results) == 40
+        assert peak > 8
+
+    def test_auto_workers_stay_small_when_cpu_bound(self):
+        """Test that the pool doesn't grow while git children use as much CPU as wall time."""
+        cfg = Config()
+        cfg.set("parallel_operations", True)
+        # Every reading is another 100s of CPU, far more than the batch's wall time
+        cpu_readings = (100.0 * i for i in itertools.count())
+        with patch.object(cli, "_cpu_time", side_effect=lambda: next(cpu_readings)):
+            results, peak = self._run_with_fake_pulls(cfg, 40)
+        assert len(results) == 40
+        assert peak <= 8
+
+    def test_scan_error_reports_running_updates_first(self):
+        """Test that updates started before a scan failure are yielded before it is raised."""
+
+        def failing_scan():
+            yield Path("/tmp/repo0")
+            raise ScanError("Permission denied: /tmp/locked")
+
+        def fake_process_repo(repo, cfg, dry_run):
+            return RepoStatus(path=repo, state=RepoState.SUCCESS, message="Successfully updated")
+
+        results = []
+        with patch.object(cli, "_process_repo", side_effect=fake_process_repo):
+            with pytest.raises(ScanError, match="Permission denied"):
+                for result in _run_updates(failing_scan(), Config(), False, MagicMock()):
+                    results.append(result)
+
+        assert [result.path for result in results] == [Path("/tmp/repo0")]
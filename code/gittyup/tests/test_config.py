@@ -2,8 +2,10 @@
 Tests for the configuration module.
 """
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 import yaml
 from gittyup.config import Config, ConfigError
 
@@ -99,6 +101,33 @@ class TestConfig:
         # Should still have defaults
         assert config.get("max_depth") == 10
 
+    def test_load_uses_parsed_config_cache(self, tmp_path, isolated_cache_dir):
+        """Test that an unchanged file is loaded from the cache without re-parsing."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("max_depth: 4\n")
+
+        Config().load_from_file(config_file)
+        assert list(isolated_cache_dir.glob("gittyup/yaml-*.json"))
+
+        config = Config()
+        with patch("gittyup.config.yaml.load", side_effect=AssertionError("re-parsed")):
+            config.load_from_file(config_file)
+        assert config.get("max_depth") == 4
+
+    def test_parsed_config_cache_invalidated_on_change(self, tmp_path):
+        """Test that editing a file invalidates its cached contents."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("max_depth: 4\n")
+        Config().load_from_file(config_file)
+
+        config_file.write_text("max_depth: 12\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config = Config()
+        config.load_from_file(config_file)
+        assert config.get("max_depth") == 12
+
     def test_merge_cli_args(self):
         """Test merging CLI arguments into configuration."""
         config = Config()
@@ -140,6 +169,28 @@ class TestConfig:
         assert patterns.count("node_modules") == 1
         assert "custom" in patterns
 
+    def test_merge_exclude_patterns_dedupes_new_patterns(self):
+        """Test that duplicates within the merged patterns are added only once."""
+        config = Config()
+        config.merge_cli_args(exclude_patterns=["custom", "other", "custom"])
+
+        patterns = config.get("exclude_patterns")
+        assert patterns.count("custom") == 1
+        assert patterns.index("custom") < patterns.index("other")
+
+    def test_merge_exclude_patterns_does_not_leak_between_instances(self):
+        """Test that extending one config's patterns leaves defaults and other configs alone."""
+        first = Config()
+        first.merge_cli_args(exclude_patterns=["custom"])
+
+        assert "custom" not in Config().get("exclude_patterns")
+        assert "custom" not in Config.DEFAULTS["exclude_patterns"]
+
+    def test_defaults_are_read_only(self):
+        """Test that the class-level defaults cannot be modified."""
+        with pytest.raises(TypeError):
+            Config.DEFAULTS["max_depth"] = 99
+
     def test_to_dict(self):
         """Test converting configuration to dictionary."""
         config = Config()
@@ -183,6 +234,14 @@ class TestConfig:
         with pytest.raises(ConfigError, match="exclude_patterns must be a list"):
             config.validate()
 
+    def test_validate_non_string_exclude_patterns(self):
+        """Test validation fails for exclude_patterns entries that aren't strings."""
+        config = Config()
+        # YAML parses an unquoted year as an int
+        config.set("exclude_patterns", ["node_modules", 2023])
+        with pytest.raises(ConfigError, match="exclude_patterns must be a list of strings"):
+            config.validate()
+
     def test_validate_invalid_timeout(self):
         """Test validation fails for invalid timeout_seconds."""
         config = Config()
@@ -190,6 +249,20 @@ class TestConfig:
         with pytest.raises(ConfigError, match="timeout_seconds must be a positive integer"):
             config.validate()
 
+    def test_validate_invalid_min_fetch_interval(self):
+        """Test validation fails for a negative min_fetch_interval_seconds."""
+        config = Config()
+        config.set("min_fetch_interval_seconds", -1)
+        with pytest.raises(ConfigError, match="min_fetch_interval_seconds must be a non-negative"):
+            config.validate()
+
+    def test_validate_invalid_max_workers(self):
+        """Test validation fails for invalid max_workers."""
+        config = Config()
+        config.set("max_workers", 0)
+        with pytest.raises(ConfigError, match="max_workers must be a positive integer"):
+            config.validate()
+
     def test_validate_invalid_boolean_flag(self):
         """Test validation fails for invalid boolean flags."""
         config = Config()
@@ -245,3 +318,21 @@ class TestConfig:
         assert isinstance(user_path, Path)
         assert "gittyup" in str(user_path)
         assert "config.yaml" in str(user_path)
+
+    def test_user_config_path_honors_xdg_config_home(self, tmp_path, monkeypatch):
+        """Test that the cached user config path still follows XDG_CONFIG_HOME."""
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+        assert Config()._get_user_config_path() == tmp_path / "gittyup" / "config.yaml"
+
+        monkeypatch.delenv("XDG_CONFIG_HOME")
+        home_path = Config()._get_user_config_path()
+        with patch("gittyup.config.Path.home", side_effect=AssertionError("home looked up")):
+            assert Config()._get_user_config_path() == home_path
+
+    def test_user_config_path_follows_changed_home(self, tmp_path, monkeypatch):
+        """Test that the cached user config path follows HOME when XDG_CONFIG_HOME is unset."""
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        for home in (tmp_path / "first", tmp_path / "second"):
+            monkeypatch.setenv("HOME", str(home))
+            expected = home / ".config" / "gittyup" / "config.yaml"
+            assert Config()._get_user_config_path() == expected
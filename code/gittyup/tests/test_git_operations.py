@@ -3,151 +3,276 @@ Tests for the git operations module.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock
+import os
 import subprocess
+import time
+from gittyup import git_operations
 from gittyup.git_operations import GitOperations
 from gittyup.exceptions import GitNotFoundError
+from gittyup.models import StatusSnapshot
+
+
+def completed(returncode=0, stdout="", stderr=""):
+    """Build the result of a finished git command."""
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr=stderr)
+
+
+# Results shared by several tests; git_operations only reads them
+SUCCEEDED = completed()
+FATAL = completed(returncode=128, stderr="fatal")
+
+
+@pytest.fixture
+def mock_run(monkeypatch):
+    """Replace subprocess.run with a mock; git commands succeed with no output by default."""
+    mock = Mock(return_value=SUCCEEDED)
+    monkeypatch.setattr(git_operations.subprocess, "run", mock)
+    return mock
 
 
 class TestGitOperations:
     """Test suite for GitOperations class."""
 
-    def test_check_git_available_success(self):
+    def setup_method(self):
+        """Clear the cached Git availability check between tests."""
+        GitOperations.check_git_available.cache_clear()
+
+    def test_check_git_available_success(self, mock_run):
         """Test checking Git availability when Git is installed."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            assert GitOperations.check_git_available() is True
-            mock_run.assert_called_once()
+        assert GitOperations.check_git_available() is True
+        mock_run.assert_called_once()
 
-    def test_check_git_available_not_found(self):
+    def test_check_git_available_not_found(self, mock_run):
         """Test checking Git availability when Git is not installed."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            assert GitOperations.check_git_available() is False
+        mock_run.side_effect = FileNotFoundError
+        assert GitOperations.check_git_available() is False
 
-    def test_check_git_available_subprocess_error(self):
+    def test_check_git_available_subprocess_error(self, mock_run):
         """Test checking Git availability when subprocess fails."""
-        with patch("subprocess.run", side_effect=subprocess.SubprocessError):
-            assert GitOperations.check_git_available() is False
+        mock_run.side_effect = subprocess.SubprocessError
+        assert GitOperations.check_git_available() is False
+
+    def test_check_git_available_cached(self, mock_run):
+        """Test that git --version runs only once per process."""
+        assert GitOperations.check_git_available() is True
+        assert GitOperations.check_git_available() is True
+        mock_run.assert_called_once()
 
-    def test_ensure_git_available_success(self):
+    def test_ensure_git_available_success(self, mock_run):
         """Test ensure_git_available when Git is available."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            # Should not raise an exception
-            GitOperations.ensure_git_available()
+        # Should not raise an exception
+        GitOperations.ensure_git_available()
 
-    def test_ensure_git_available_raises_error(self):
+    def test_ensure_git_available_raises_error(self, mock_run):
         """Test ensure_git_available raises error when Git is not available."""
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            with pytest.raises(GitNotFoundError, match="Git is not installed"):
-                GitOperations.ensure_git_available()
-
-    def test_pull_repository_success(self, tmp_path):
-        """Test successful repository pull."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0, stdout="Updating...\nFast-forward", stderr=""
-            )
-            success, message = GitOperations.pull_repository(tmp_path)
-
-            assert success is True
-            assert message == "Successfully updated"
-            mock_run.assert_called_once()
-
-    def test_pull_repository_already_up_to_date(self, tmp_path):
-        """Test pulling repository that's already up to date."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="Already up to date.", stderr="")
-            success, message = GitOperations.pull_repository(tmp_path)
-
-            assert success is True
-            assert message == "Already up to date"
-
-    def test_pull_repository_error(self, tmp_path):
-        """Test pulling repository with error."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1, stdout="", stderr="fatal: not a git repository"
-            )
-            success, message = GitOperations.pull_repository(tmp_path)
-
-            assert success is False
-            assert "fatal" in message.lower()
-
-    def test_pull_repository_timeout(self, tmp_path):
-        """Test pulling repository with timeout."""
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 30)):
-            success, message = GitOperations.pull_repository(tmp_path)
-
-            assert success is False
-            assert "timed out" in message.lower()
-
-    def test_pull_repository_subprocess_error(self, tmp_path):
-        """Test pulling repository with subprocess error."""
-        with patch("subprocess.run", side_effect=subprocess.SubprocessError("error")):
-            success, message = GitOperations.pull_repository(tmp_path)
-
-            assert success is False
-            assert "error" in message.lower()
-
-    def test_get_repository_status_clean(self, tmp_path):
+        mock_run.side_effect = FileNotFoundError
+        with pytest.raises(GitNotFoundError, match="Git is not installed"):
+            GitOperations.ensure_git_available()
+
+    @pytest.mark.parametrize(
+        "result, expected",
+        [
+            pytest.param(
+                completed(stdout="Updating...\nFast-forward"),
+                (True, "Successfully updated"),
+                id="updated",
+            ),
+            pytest.param(
+                completed(stdout="Already up to date."),
+                (True, "Already up to date"),
+                id="up_to_date",
+            ),
+            pytest.param(
+                completed(stdout="Already up-to-date."),
+                (True, "Already up to date"),
+                id="up_to_date_old_git",
+            ),
+            pytest.param(
+                completed(returncode=1, stderr="fatal: not a git repository"),
+                (False, "fatal: not a git repository"),
+                id="error",
+            ),
+        ],
+    )
+    def test_pull_repository(self, tmp_path, mock_run, result, expected):
+        """Test the outcome reported for each git pull result."""
+        mock_run.return_value = result
+
+        assert GitOperations.pull_repository(tmp_path) == expected
+        mock_run.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error, expected_message",
+        [
+            pytest.param(subprocess.TimeoutExpired("git", 30), "timed out", id="timeout"),
+            pytest.param(subprocess.SubprocessError("error"), "error", id="subprocess_error"),
+        ],
+    )
+    def test_pull_repository_exceptions(self, tmp_path, mock_run, error, expected_message):
+        """Test that a pull that can't run reports failure instead of raising."""
+        mock_run.side_effect = error
+        success, message = GitOperations.pull_repository(tmp_path)
+
+        assert success is False
+        assert expected_message in message.lower()
+
+    def test_get_repository_status_clean(self, tmp_path, mock_run):
         """Test getting status of a clean repository."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-            is_clean, status = GitOperations.get_repository_status(tmp_path)
+        is_clean, status = GitOperations.get_repository_status(tmp_path)
 
-            assert is_clean is True
-            assert status == "Clean"
+        assert is_clean is True
+        assert status == "Clean"
 
-    def test_get_repository_status_dirty(self, tmp_path):
+    def test_get_repository_status_dirty(self, tmp_path, mock_run):
         """Test getting status of a dirty repository."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout=" M file.txt\n", stderr="")
-            is_clean, status = GitOperations.get_repository_status(tmp_path)
+        mock_run.return_value = completed(stdout=" M file.txt\n")
+        is_clean, status = GitOperations.get_repository_status(tmp_path)
 
-            assert is_clean is False
-            assert status == "Uncommitted changes"
+        assert is_clean is False
+        assert status == "Uncommitted changes"
 
-    def test_get_repository_status_error(self, tmp_path):
+    def test_get_repository_status_error(self, tmp_path, mock_run):
         """Test getting status with error."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error")
-            is_clean, status = GitOperations.get_repository_status(tmp_path)
+        mock_run.return_value = completed(returncode=1, stderr="error")
+        is_clean, status = GitOperations.get_repository_status(tmp_path)
 
-            assert is_clean is False
-            assert "Unable to get status" in status
+        assert is_clean is False
+        assert "Unable to get status" in status
 
-    def test_get_repository_status_timeout(self, tmp_path):
+    def test_get_repository_status_timeout(self, tmp_path, mock_run):
         """Test getting status with timeout."""
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("git", 5)):
-            is_clean, status = GitOperations.get_repository_status(tmp_path)
+        mock_run.side_effect = subprocess.TimeoutExpired("git", 5)
+        is_clean, status = GitOperations.get_repository_status(tmp_path)
+
+        assert is_clean is False
+        assert "Timeout" in status
+
+    def test_get_full_status_clean_with_upstream(self, tmp_path, mock_run):
+        """Test full status of a clean repository tracking an upstream."""
+        stdout = (
+            "# branch.oid 1234abcd\n"
+            "# branch.head main\n"
+            "# branch.upstream origin/main\n"
+            "# branch.ab +0 -0\n"
+        )
+        mock_run.return_value = completed(stdout=stdout)
+        snapshot = GitOperations.get_full_status(tmp_path)
+
+        assert snapshot == StatusSnapshot(
+            is_clean=True, message="Clean", branch="main", upstream="origin/main", head="1234abcd"
+        )
+        mock_run.assert_called_once()
+
+    def test_get_full_status_initial_commit(self, tmp_path, mock_run):
+        """Test full status of a repository with no commits yet."""
+        stdout = "# branch.oid (initial)\n# branch.head main\n"
+        mock_run.return_value = completed(stdout=stdout)
+        snapshot = GitOperations.get_full_status(tmp_path)
 
-            assert is_clean is False
-            assert "Timeout" in status
+        assert snapshot.head is None
 
-    def test_has_upstream_true(self, tmp_path):
+    def test_get_full_status_dirty_without_upstream(self, tmp_path, mock_run):
+        """Test full status of a dirty repository with no upstream."""
+        stdout = "# branch.oid 1234abcd\n# branch.head feature\n? new_file.txt\n"
+        mock_run.return_value = completed(stdout=stdout)
+        snapshot = GitOperations.get_full_status(tmp_path)
+
+        assert snapshot == StatusSnapshot(
+            is_clean=False, message="Uncommitted changes", branch="feature", head="1234abcd"
+        )
+
+    def test_get_full_status_error(self, tmp_path, mock_run):
+        """Test full status when git status fails."""
+        mock_run.return_value = FATAL
+        snapshot = GitOperations.get_full_status(tmp_path)
+
+        assert snapshot.is_clean is False
+        assert "Unable to get status" in snapshot.message
+        assert snapshot.upstream is None
+
+    def test_get_full_status_timeout(self, tmp_path, mock_run):
+        """Test full status with timeout."""
+        mock_run.side_effect = subprocess.TimeoutExpired("git", 5)
+        snapshot = GitOperations.get_full_status(tmp_path)
+
+        assert snapshot.is_clean is False
+        assert "Timeout" in snapshot.message
+
+    def test_count_new_commits(self, tmp_path, mock_run):
+        """Test counting commits brought in by a pull."""
+        mock_run.return_value = completed(stdout="3\n")
+        assert GitOperations.count_new_commits(tmp_path, "abc123") == 3
+
+        args = mock_run.call_args[0][0]
+        assert args == ["git", "rev-list", "--count", "abc123..@{upstream}"]
+
+    def test_count_new_commits_error(self, tmp_path, mock_run):
+        """Test counting commits when git rev-list fails."""
+        mock_run.return_value = FATAL
+        assert GitOperations.count_new_commits(tmp_path, "abc123") is None
+
+    def test_repository_removed_during_run(self, tmp_path, mock_run):
+        """Test that a repository deleted after the scan gives results instead of raising."""
+        mock_run.side_effect = FileNotFoundError("No such file or directory")
+
+        snapshot = GitOperations.get_full_status(tmp_path / "gone")
+        assert snapshot.is_clean is False
+        assert snapshot.message == "Error checking status"
+        assert GitOperations.count_new_commits(tmp_path / "gone", "abc123") is None
+
+    def test_seconds_since_fetch(self, tmp_path):
+        """Test fetch age is read from .git/FETCH_HEAD."""
+        (tmp_path / ".git").mkdir()
+        fetch_head = tmp_path / ".git" / "FETCH_HEAD"
+        fetch_head.write_text("")
+        os.utime(fetch_head, (time.time() - 120, time.time() - 120))
+
+        age = GitOperations.seconds_since_fetch(tmp_path)
+        assert age is not None
+        assert 119 <= age < 180
+
+    def test_seconds_since_fetch_never_fetched(self, tmp_path):
+        """Test fetch age is None when the repository was never fetched."""
+        (tmp_path / ".git").mkdir()
+        assert GitOperations.seconds_since_fetch(tmp_path) is None
+
+    def test_get_git_dir_follows_gitfile(self, tmp_path):
+        """Test that a .git file (worktree/submodule) is resolved to its gitdir."""
+        real_git_dir = tmp_path / "real.git"
+        real_git_dir.mkdir()
+        worktree = tmp_path / "worktree"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {real_git_dir}\n")
+
+        assert GitOperations.get_git_dir(worktree) == real_git_dir
+
+    def test_has_upstream_true(self, tmp_path, mock_run):
         """Test checking upstream when it exists."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
-            assert GitOperations.has_upstream(tmp_path) is True
+        assert GitOperations.has_upstream(tmp_path) is True
 
-    def test_has_upstream_false(self, tmp_path):
+    def test_has_upstream_false(self, tmp_path, mock_run):
         """Test checking upstream when it doesn't exist."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1)
-            assert GitOperations.has_upstream(tmp_path) is False
+        mock_run.return_value = completed(returncode=1)
+        assert GitOperations.has_upstream(tmp_path) is False
 
-    def test_has_upstream_error(self, tmp_path):
+    def test_has_upstream_error(self, tmp_path, mock_run):
         """Test checking upstream with subprocess error."""
-        with patch("subprocess.run", side_effect=subprocess.SubprocessError):
-            assert GitOperations.has_upstream(tmp_path) is False
+        mock_run.side_effect = subprocess.SubprocessError
+        assert GitOperations.has_upstream(tmp_path) is False
+
+    def test_git_env_disables_optional_locks(self, tmp_path, mock_run):
+        """Test that git runs with optional locks disabled and a stable locale."""
+        GitOperations.get_full_status(tmp_path)
+
+        env = mock_run.call_args[1]["env"]
+        assert env["GIT_OPTIONAL_LOCKS"] == "0"
+        assert env["LC_ALL"] == "C"
 
-    def test_pull_repository_custom_timeout(self, tmp_path):
+    def test_pull_repository_custom_timeout(self, tmp_path, mock_run):
         """Test that custom timeout is respected."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-            GitOperations.pull_repository(tmp_path, timeout=60)
+        GitOperations.pull_repository(tmp_path, timeout=60)
 
-            # Check that timeout was passed to subprocess.run
-            call_kwargs = mock_run.call_args[1]
-            assert call_kwargs["timeout"] == 60
+        # Check that timeout was passed to subprocess.run
+        call_kwargs = mock_run.call_args[1]
+        assert call_kwargs["timeout"] == 60
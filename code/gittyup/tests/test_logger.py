@@ -2,20 +2,55 @@
 Tests for the logger module.
 """
 
+import logging
 from pathlib import Path
-import tempfile
-from gittyup.logger import GittyUpLogger
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+import pytest
+from gittyup.logger import GittyUpLogger, _CachedTimeFormatter, close_file_handlers
+
+
+def assert_logged(log_file: Path, *expected: bytes) -> None:
+    """Assert that every expected fragment appears in the log file."""
+    content = log_file.read_bytes()
+    missing = [fragment for fragment in expected if fragment not in content]
+    assert not missing, f"missing from log: {missing}"
+
+
+def assert_captured(caplog: pytest.LogCaptureFixture, *expected: str) -> None:
+    """Assert that every expected fragment was logged, without reading the log file."""
+    text = caplog.text
+    missing = [fragment for fragment in expected if fragment not in text]
+    assert not missing, f"missing from captured log: {missing}"
+
+
+@pytest.fixture
+def log_dir(tmp_path):
+    """Directory for a test's log file, cleaned up by pytest."""
+    return tmp_path / "logs"
+
+
+@pytest.fixture
+def log_file(log_dir):
+    """Path of the log file written by loggers in log_dir."""
+    return log_dir / "gittyup.log"
+
+
+@pytest.fixture
+def file_logger(log_dir):
+    """An enabled logger writing to log_dir."""
+    return GittyUpLogger(log_dir=log_dir, enabled=True)
 
 
 class TestGittyUpLogger:
     """Test suite for GittyUpLogger class."""
 
-    def test_init_enabled(self):
+    def test_init_enabled(self, file_logger):
         """Test logger initialization when enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            logger = GittyUpLogger(log_dir=Path(tmpdir), enabled=True)
-            assert logger.enabled is True
-            assert logger.logger is not None
+        assert file_logger.enabled is True
+        assert file_logger.logger is not None
 
     def test_init_disabled(self):
         """Test logger initialization when disabled."""
@@ -24,141 +59,125 @@ class TestGittyUpLogger:
         # When disabled, logger level is set to CRITICAL to suppress all output
         assert len(logger.logger.handlers) == 0 or logger.logger.level >= 50
 
-    def test_log_file_created(self):
+    def test_log_file_created(self, file_logger, log_file):
         """Test that log file is created."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-            logger.info("Test message")
+        file_logger.info("Test message")
 
-            log_file = log_dir / "gittyup.log"
-            assert log_file.exists()
+        assert log_file.exists()
 
-    def test_log_messages(self):
+    def test_log_messages(self, file_logger, log_file):
         """Test that log messages are written to file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+        file_logger.debug("Debug message")
+        file_logger.info("Info message")
+        file_logger.warning("Warning message")
+        file_logger.error("Error message")
 
-            logger.debug("Debug message")
-            logger.info("Info message")
-            logger.warning("Warning message")
-            logger.error("Error message")
+        assert_logged(
+            log_file, b"Debug message", b"Info message", b"Warning message", b"Error message"
+        )
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
+    def test_file_handler_shared_across_loggers(self, file_logger, log_dir, log_file):
+        """Test that loggers for the same directory reuse one open file handler."""
+        handler = file_logger.logger.handlers[0]
 
-            assert "Debug message" in content
-            assert "Info message" in content
-            assert "Warning message" in content
-            assert "Error message" in content
+        second = GittyUpLogger(log_dir=log_dir, enabled=True)
+        second.info("Second logger message")
 
-    def test_logging_disabled_no_writes(self):
+        assert second.logger.handlers == [handler]
+        assert_logged(log_file, b"Second logger message")
+
+    def test_formatter_shared_across_log_files(self, file_logger, tmp_path):
+        """Test that handlers for different log files share one formatter."""
+        handler = file_logger.logger.handlers[0]
+
+        other = GittyUpLogger(log_dir=tmp_path / "other", enabled=True)
+        other_handler = other.logger.handlers[0]
+
+        assert other_handler is not handler
+        assert other_handler.formatter is handler.formatter
+
+    def test_close_file_handlers(self, file_logger, log_file):
+        """Test that closing the shared handlers flushes, closes and forgets them."""
+        handler = file_logger.logger.handlers[0]
+        file_logger.info("Before close")
+
+        close_file_handlers()
+
+        assert handler.stream is None
+        assert file_logger.logger.handlers == []
+        assert_logged(log_file, b"Before close")
+        # A new logger opens a fresh handler for the same file
+        assert GittyUpLogger(log_dir=log_file.parent).logger.handlers[0] is not handler
+
+    def test_logging_disabled_no_writes(self, log_dir, log_file):
         """Test that disabled logger doesn't write to files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=False)
+        logger = GittyUpLogger(log_dir=log_dir, enabled=False)
 
-            logger.info("This should not be written")
+        logger.info("This should not be written")
 
-            log_file = log_dir / "gittyup.log"
-            assert not log_file.exists()
+        assert not log_file.exists()
 
-    def test_log_scan_start(self):
-        """Test logging scan start."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+    def test_disabled_logger_skips_formatting(self):
+        """Test that message arguments are not formatted when logging is disabled."""
+
+        class Unformattable:
+            def __str__(self):
+                raise AssertionError("argument was formatted")
 
-            logger.log_scan_start("/test/path", 10)
+        logger = GittyUpLogger(enabled=False)
+        logger.debug("Value: %s", Unformattable())
+        logger.info("Value: %s", Unformattable())
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Starting scan" in content
-            assert "/test/path" in content
-            assert "max_depth=10" in content
+    def test_log_message_arguments(self, file_logger, log_file):
+        """Test that %-style arguments are interpolated into the log file."""
+        file_logger.info("Pulled %d commits into %s", 3, "/test/repo")
 
-    def test_log_scan_complete(self):
-        """Test logging scan completion."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+        assert_logged(log_file, b"Pulled 3 commits into /test/repo")
 
-            logger.log_scan_complete(5, 1.23)
+    def test_log_scan_start(self, file_logger, caplog):
+        """Test logging scan start."""
+        file_logger.log_scan_start("/test/path", 10)
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Scan complete" in content
-            assert "5 repositories" in content
+        assert_captured(caplog, "Starting scan", "/test/path", "max_depth=10")
 
-    def test_log_repo_update_success(self):
-        """Test logging successful repository update."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+    def test_log_scan_complete(self, file_logger, caplog):
+        """Test logging scan completion."""
+        file_logger.log_scan_complete(5, 1.23)
 
-            logger.log_repo_update_success("/test/repo", "Updated successfully")
+        assert_captured(caplog, "Scan complete", "5 repositories")
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Update successful" in content
-            assert "/test/repo" in content
-            assert "Updated successfully" in content
+    def test_log_repo_update_success(self, file_logger, caplog):
+        """Test logging successful repository update."""
+        file_logger.log_repo_update_success("/test/repo", "Updated successfully")
 
-    def test_log_repo_update_skip(self):
-        """Test logging skipped repository update."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+        assert_captured(caplog, "Update successful", "/test/repo", "Updated successfully")
 
-            logger.log_repo_update_skip("/test/repo", "Uncommitted changes")
+    def test_log_repo_update_skip(self, file_logger, caplog):
+        """Test logging skipped repository update."""
+        file_logger.log_repo_update_skip("/test/repo", "Uncommitted changes")
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Update skipped" in content
-            assert "/test/repo" in content
-            assert "Uncommitted changes" in content
+        assert_captured(caplog, "Update skipped", "/test/repo", "Uncommitted changes")
 
-    def test_log_repo_update_error(self):
+    def test_log_repo_update_error(self, file_logger, caplog):
         """Test logging failed repository update."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+        file_logger.log_repo_update_error("/test/repo", "Network error")
 
-            logger.log_repo_update_error("/test/repo", "Network error")
+        assert_captured(caplog, "Update failed", "/test/repo", "Network error")
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Update failed" in content
-            assert "/test/repo" in content
-            assert "Network error" in content
-
-    def test_log_operation_summary(self):
+    def test_log_operation_summary(self, file_logger, caplog):
         """Test logging operation summary."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-
-            logger.log_operation_summary(total=10, updated=7, skipped=2, errors=1, duration=5.5)
+        file_logger.log_operation_summary(total=10, updated=7, skipped=2, errors=1, duration=5.5)
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Operation complete" in content
-            assert "total=10" in content
-            assert "updated=7" in content
-            assert "skipped=2" in content
-            assert "errors=1" in content
+        assert_captured(
+            caplog, "Operation complete", "total=10", "updated=7", "skipped=2", "errors=1"
+        )
 
-    def test_get_log_file_path_enabled(self):
+    def test_get_log_file_path_enabled(self, file_logger):
         """Test getting log file path when logging is enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-
-            log_path = logger.get_log_file_path()
-            assert log_path is not None
-            assert isinstance(log_path, Path)
-            assert "gittyup.log" in str(log_path)
+        log_path = file_logger.get_log_file_path()
+        assert log_path is not None
+        assert isinstance(log_path, Path)
+        assert "gittyup.log" in str(log_path)
 
     def test_get_log_file_path_disabled(self):
         """Test getting log file path when logging is disabled."""
@@ -166,77 +185,78 @@ class TestGittyUpLogger:
         log_path = logger.get_log_file_path()
         assert log_path is None
 
-    def test_log_file_rotation(self):
+    def test_log_file_rotation(self, file_logger, log_file, monkeypatch):
         """Test that log files rotate when size limit is reached."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
+        handler = file_logger.logger.handlers[0]
+        assert handler.maxBytes == 10 * 1024 * 1024
+        assert handler.backupCount == 10
 
-            # Write a lot of data to trigger rotation
-            # Note: This test might not actually trigger rotation in a unit test
-            # but ensures the rotation is configured
-            for i in range(1000):
-                logger.info(f"Message {i}" + "X" * 100)
+        # Shrink the limit so two records are enough to trigger a rollover
+        monkeypatch.setattr(handler, "maxBytes", 200)
+        file_logger.info("X" * 200)
+        file_logger.info("After rollover")
 
-            log_file = log_dir / "gittyup.log"
-            assert log_file.exists()
+        assert log_file.with_name("gittyup.log.1").exists()
+        assert_logged(log_file, b"After rollover")
 
-    def test_default_log_dir(self):
+    def test_default_log_dir(self, file_logger):
         """Test that default log directory is determined correctly."""
-        # Use a temp directory to avoid permission issues
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-            log_path = logger.get_log_file_path()
+        log_path = file_logger.get_log_file_path()
 
-            assert log_path is not None
-            # Should contain gittyup.log
-            assert "gittyup.log" in str(log_path)
+        assert log_path is not None
+        # Should contain gittyup.log
+        assert "gittyup.log" in str(log_path)
 
-    def test_debug_method(self):
+    def test_debug_method(self, file_logger, log_file):
         """Test debug logging method."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-            logger.debug("Debug test")
+        file_logger.debug("Debug test")
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Debug test" in content
-            assert "DEBUG" in content
+        assert_logged(log_file, b"Debug test", b"DEBUG")
 
-    def test_info_method(self):
+    def test_info_method(self, file_logger, log_file):
         """Test info logging method."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-            logger.info("Info test")
+        file_logger.info("Info test")
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Info test" in content
-            assert "INFO" in content
+        assert_logged(log_file, b"Info test", b"INFO")
 
-    def test_warning_method(self):
+    def test_warning_method(self, file_logger, log_file):
         """Test warning logging method."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-            logger.warning("Warning test")
+        file_logger.warning("Warning test")
 
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Warning test" in content
-            assert "WARNING" in content
+        assert_logged(log_file, b"Warning test", b"WARNING")
 
-    def test_error_method(self):
+    def test_error_method(self, file_logger, log_file):
         """Test error logging method."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_dir = Path(tmpdir)
-            logger = GittyUpLogger(log_dir=log_dir, enabled=True)
-            logger.error("Error test")
-
-            log_file = log_dir / "gittyup.log"
-            content = log_file.read_text()
-            assert "Error test" in content
-            assert "ERROR" in content
+        file_logger.error("Error test")
+
+        assert_logged(log_file, b"Error test", b"ERROR")
+
+    def test_import_keeps_global_logging_flags(self):
+        """Test that importing the package leaves process-wide logging settings alone."""
+        code = "import logging, gittyup.logger; print(logging.logThreads, logging.logProcesses)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.split() == ["True", "True"]
+
+    def test_log_scan_start_without_max_depth(self, file_logger, caplog):
+        """Test that a missing max_depth is logged instead of failing to format."""
+        file_logger.log_scan_start("/test/path", None)
+
+        assert_captured(caplog, "max_depth=None")
+
+    def test_cached_time_formatter(self):
+        """Test that timestamps are formatted once per second and match the default."""
+        formatter = _CachedTimeFormatter("%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+        reference = logging.Formatter("%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+        first = logging.makeLogRecord({"msg": "first", "created": 1700000000.1})
+        second = logging.makeLogRecord({"msg": "second", "created": 1700000000.9})
+        later = logging.makeLogRecord({"msg": "later", "created": 1700000001.2})
+
+        expected = [reference.format(record) for record in (first, second, later)]
+
+        with patch("gittyup.logger.time.strftime", wraps=time.strftime) as strftime:
+            assert formatter.format(first) == expected[0]
+            assert formatter.format(second) == expected[1]
+            assert strftime.call_count == 1
+
+            assert formatter.format(later) == expected[2]
+            assert strftime.call_count == 2
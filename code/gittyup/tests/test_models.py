@@ -0,0 +1,78 @@
+"""
+Tests for the models module.
+"""
+
+import dataclasses
+import sys
+from pathlib import Path
+import pytest
+from gittyup.models import RepoState, RepoStatus, SummaryStats
+
+# Paths are immutable, so tests share one instance instead of re-parsing the string
+REPO = Path("/tmp/repo")
+
+
+def make_stats(*states: RepoState) -> SummaryStats:
+    """Build SummaryStats holding one result per given state."""
+    stats = SummaryStats()
+    for state in states:
+        stats.add_result(RepoStatus(path=REPO, state=state))
+    return stats
+
+
+class TestSummaryStats:
+    """Test suite for SummaryStats class."""
+
+    def test_defaults(self):
+        """Test that a new SummaryStats starts empty."""
+        stats = SummaryStats()
+        assert (stats.total, stats.updated, stats.skipped, stats.errors) == (0, 0, 0, 0)
+
+    def test_add_result_counts_states(self):
+        """Test that add_result updates the matching counter."""
+        stats = make_stats(
+            RepoState.SUCCESS, RepoState.SKIPPED, RepoState.FAILED, RepoState.SUCCESS
+        )
+
+        assert (stats.total, stats.updated, stats.skipped, stats.errors) == (4, 2, 1, 1)
+
+    def test_add_result_keeps_order(self):
+        """Test that results are kept in the order they were added."""
+        stats = make_stats(RepoState.FAILED, RepoState.SUCCESS)
+        assert [result.state for result in stats.results] == [
+            RepoState.FAILED,
+            RepoState.SUCCESS,
+        ]
+
+    def test_add_result_dry_run_not_counted(self):
+        """Test that dry-run results are recorded but not counted as updates."""
+        stats = make_stats(RepoState.DRY_RUN)
+
+        assert (stats.total, stats.updated, stats.skipped, stats.errors) == (1, 0, 0, 0)
+
+
+class TestRepoStatus:
+    """Test suite for RepoStatus class."""
+
+    def test_defaults(self):
+        """Test that message defaults to an empty string."""
+        status = RepoStatus(path=REPO, state=RepoState.SUCCESS)
+        assert status.message == ""
+
+    def test_already_up_to_date(self):
+        """Test that only a pull with zero new commits counts as up to date."""
+        assert RepoStatus(REPO, RepoState.SUCCESS, commits_pulled=0).already_up_to_date
+        assert not RepoStatus(REPO, RepoState.SUCCESS, commits_pulled=2).already_up_to_date
+        assert not RepoStatus(REPO, RepoState.SUCCESS).already_up_to_date
+
+    def test_is_frozen(self):
+        """Test that results can't be modified after creation."""
+        status = RepoStatus(path=REPO, state=RepoState.SUCCESS)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            status.message = "changed"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_uses_slots(self):
+        """Test that instances don't carry a per-instance __dict__."""
+        status = RepoStatus(path=REPO, state=RepoState.SUCCESS)
+        assert not hasattr(status, "__dict__")
@@ -0,0 +1,194 @@
+"""
+Tests for the output module.
+"""
+
+import io
+import sys
+from pathlib import Path
+from typing import Sequence
+from unittest.mock import patch
+
+import pytest
+
+from rich.console import Console
+
+from gittyup.models import RepoState, RepoStatus
+from gittyup.output import OutputFormatter
+from gittyup.output_rich import RichOutputFormatter
+
+# Results shared by the results table tests; RepoStatus is frozen, so reuse is safe
+PULLED = RepoStatus(Path("/tmp/pulled"), RepoState.SUCCESS, "Successfully updated", 3)
+BROKEN = RepoStatus(Path("/tmp/broken"), RepoState.FAILED, "fatal: error")
+
+
+def _redirect_stdout(monkeypatch: pytest.MonkeyPatch, tty: bool = True) -> io.StringIO:
+    """
+    Replace sys.stdout with a buffer for the rest of the test.
+
+    Called from the test body: pytest re-installs its own capture after
+    fixture setup, which would replace a stream patched in a fixture.
+    """
+    buffer = io.StringIO()
+    buffer.isatty = lambda: tty
+    monkeypatch.setattr(sys, "stdout", buffer)
+    return buffer
+
+
+def assert_output(output: str, present: Sequence[str] = (), absent: Sequence[str] = ()) -> None:
+    """Assert fragments that must and must not appear, reporting every mismatch at once."""
+    missing = [text for text in present if text not in output]
+    unexpected = [text for text in absent if text in output]
+    assert (missing, unexpected) == ([], [])
+
+
+def _print_run(formatter: OutputFormatter) -> None:
+    """Print a banner, one repository line and a summary."""
+    formatter.print_banner()
+    formatter.print_success("repo", "Already up to date")
+    formatter.print_summary(1, 1, 0, 0, 0.5)
+
+
+class TestOutputFormatter:
+    """Test suite for OutputFormatter."""
+
+    @pytest.mark.parametrize(
+        "no_color, tty, expected, unexpected",
+        [
+            pytest.param(
+                False, True, ["\x1b[", "Gitty Up", "Already up to date"], [], id="colored"
+            ),
+            pytest.param(
+                False, False, ["Already up to date"], ["\x1b[", "Gitty Up"], id="redirected"
+            ),
+            pytest.param(True, True, ["✓ repo", "✓ Updated: 1"], ["\x1b["], id="no_color"),
+        ],
+    )
+    def test_output_modes(self, monkeypatch, no_color, tty, expected, unexpected):
+        """Test colors and the banner for terminals, redirected output and no_color."""
+        stdout = _redirect_stdout(monkeypatch, tty=tty)
+        _print_run(OutputFormatter(no_color=no_color))
+        output = stdout.getvalue()
+
+        assert_output(output, expected, unexpected)
+
+    @pytest.mark.parametrize(
+        "method, expected",
+        [
+            ("print_success", "✓ repo"),
+            ("print_warning", "⚠ repo"),
+            ("print_error", "✗ repo"),
+            ("print_skipped", "○ repo"),
+        ],
+    )
+    def test_repo_lines(self, monkeypatch, method, expected):
+        """Test the marker and padded name printed for each repository outcome."""
+        stdout = _redirect_stdout(monkeypatch)
+        getattr(OutputFormatter(no_color=True), method)("repo", "details")
+        output = stdout.getvalue()
+
+        assert output.startswith(expected + " " * 27)
+        assert output.endswith("details\n")
+
+    @pytest.mark.parametrize(
+        "count, expected",
+        [
+            (0, "⚠️  No repositories found"),
+            (1, "✓ Found 1 repository"),
+            (3, "✓ Found 3 repositories"),
+        ],
+    )
+    def test_format_found_repos(self, count, expected):
+        """Test the wording of the repository count."""
+        assert OutputFormatter(no_color=True).format_found_repos(count) == expected
+
+    @pytest.mark.parametrize(
+        "count, expected",
+        [
+            (1, "✓ Scan complete: 1 repository found"),
+            (3, "✓ Scan complete: 3 repositories found"),
+        ],
+    )
+    def test_format_scan_complete(self, count, expected):
+        """Test the wording of the count reported when a streaming scan ends."""
+        assert OutputFormatter(no_color=True).format_scan_complete(count) == expected
+
+    @pytest.mark.parametrize(
+        "counts, expected, unexpected",
+        [
+            pytest.param(
+                (10, 7, 2, 1),
+                ["Total repositories: 10", "✓ Updated: 7", "○ Skipped: 2", "✗ Errors: 1"],
+                [],
+                id="all_rows",
+            ),
+            pytest.param(
+                (3, 3, 0, 0),
+                ["Total repositories: 3", "✓ Updated: 3"],
+                ["Skipped", "Errors"],
+                id="zero_counts_hidden",
+            ),
+        ],
+    )
+    def test_format_summary(self, counts, expected, unexpected):
+        """Test that the summary lists totals and hides rows with a zero count."""
+        summary = OutputFormatter(no_color=True).format_summary(*counts, elapsed_time=5.5)
+
+        assert_output(summary, [*expected, "Time elapsed: 5.50s"], unexpected)
+
+
+class TestRichOutputFormatter:
+    """Test suite for RichOutputFormatter."""
+
+    def _formatter(self, **kwargs) -> RichOutputFormatter:
+        """Create a formatter whose console writes plain text to a buffer."""
+        formatter = RichOutputFormatter(**kwargs)
+        formatter.console = Console(file=io.StringIO(), width=120, color_system=None)
+        return formatter
+
+    def test_redirected_output_skips_banner_and_progress(self):
+        """Test that a non-terminal console gets no banner and a disabled progress bar."""
+        with patch("gittyup.output_rich.Console") as mock_console:
+            mock_console.return_value = Console(file=io.StringIO(), force_terminal=False)
+            formatter = RichOutputFormatter()
+
+        formatter.print_banner()
+        assert formatter.console.file.getvalue() == ""
+        assert formatter.create_progress_bar().disable is True
+
+    def test_repo_line_message_is_not_markup(self):
+        """Test that repository messages are printed literally, not parsed as markup."""
+        formatter = self._formatter()
+
+        formatter.print_error("repo", "error: [red] is not markup")
+
+        output = formatter.console.file.getvalue()
+        assert_output(output, ["✗ repo", "error: [red] is not markup"])
+
+    def test_results_table(self):
+        """Test that the results table lists each result and honors show_uptodate."""
+        formatter = self._formatter()
+        results = [
+            PULLED,
+            RepoStatus(Path("/tmp/current"), RepoState.SUCCESS, "Already up to date", 0),
+            RepoStatus(Path("/tmp/dirty"), RepoState.SKIPPED, "Uncommitted changes"),
+            BROKEN,
+        ]
+
+        formatter.print_results_table(results, show_uptodate=False)
+
+        output = formatter.console.file.getvalue()
+        assert_output(
+            output,
+            present=["pulled", "Skipped: Uncommitted changes", "fatal: error"],
+            absent=["current"],
+        )
+
+    def test_results_table_quiet_shows_only_errors(self):
+        """Test that quiet mode keeps only failed repositories in the table."""
+        formatter = self._formatter(quiet=True)
+        results = [PULLED, BROKEN]
+
+        formatter.print_results_table(results)
+
+        output = formatter.console.file.getvalue()
+        assert_output(output, present=["broken"], absent=["pulled"])
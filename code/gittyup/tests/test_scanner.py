@@ -2,28 +2,67 @@
 Tests for the repository scanner module.
 """
 
+import errno
 import pytest
-from gittyup.scanner import RepositoryScanner
+from unittest.mock import patch
+from gittyup.scanner import RepositoryScanner, compile_exclude_patterns
 from gittyup.exceptions import ScanError
 
 
+def build_tree(root, paths):
+    """Create each directory in paths (relative to root), with its parents."""
+    for path in paths:
+        (root / path).mkdir(parents=True, exist_ok=True)
+
+
+def make_repo(path):
+    """Create a directory holding an empty .git directory, with its parents, and return it."""
+    (path / ".git").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture(scope="module")
+def repo_tree(tmp_path_factory):
+    """
+    Read-only tree shared by the scan tests in this module.
+
+    Holds repositories that should be found (alpha, beta, zebra, old-project and
+    level1/level2/level3) next to ones that are excluded by default
+    (node_modules/package) or hidden (.hidden/repo).
+    """
+    root = tmp_path_factory.mktemp("repo_tree")
+    for repo in (
+        "zebra",
+        "alpha",
+        "beta",
+        "old-project",
+        "level1/level2/level3",
+        "node_modules/package",
+        ".hidden/repo",
+    ):
+        make_repo(root / repo)
+    return root
+
+
 class TestRepositoryScanner:
     """Test suite for RepositoryScanner class."""
 
     def test_init_default_excludes(self):
         """Test that default exclude patterns are set."""
         scanner = RepositoryScanner(root_path=".")
-        assert "node_modules" in scanner.exclude_patterns
-        assert "venv" in scanner.exclude_patterns
-        assert "__pycache__" in scanner.exclude_patterns
+        assert {"node_modules", "venv", "__pycache__"} <= scanner.exclude_patterns
 
     def test_init_custom_excludes(self):
         """Test that custom exclude patterns are added."""
         scanner = RepositoryScanner(root_path=".", exclude_patterns=["custom1", "custom2"])
-        assert "custom1" in scanner.exclude_patterns
-        assert "custom2" in scanner.exclude_patterns
         # Default excludes should still be present
-        assert "node_modules" in scanner.exclude_patterns
+        assert {"custom1", "custom2", "node_modules"} <= scanner.exclude_patterns
+
+    def test_exclude_patterns_are_frozen(self):
+        """Test that the combined exclude patterns are an immutable set."""
+        scanner = RepositoryScanner(root_path=".", exclude_patterns=["custom"])
+        assert isinstance(scanner.exclude_patterns, frozenset)
+        assert {"custom", "node_modules"} <= scanner.exclude_patterns
 
     def test_scan_nonexistent_path(self):
         """Test that scanning a nonexistent path raises ScanError."""
@@ -31,6 +70,13 @@ class TestRepositoryScanner:
         with pytest.raises(ScanError, match="Path does not exist"):
             scanner.scan()
 
+    def test_scan_inaccessible_path(self, tmp_path):
+        """Test that root errors other than a missing path keep their own message."""
+        io_error = OSError(errno.EIO, "Input/output error")
+        with patch("gittyup.scanner.os.stat", side_effect=io_error):
+            with pytest.raises(ScanError, match="Cannot access .*Input/output error"):
+                RepositoryScanner(root_path=str(tmp_path)).scan()
+
     def test_scan_file_not_directory(self, tmp_path):
         """Test that scanning a file raises ScanError."""
         test_file = tmp_path / "test.txt"
@@ -40,97 +86,68 @@ class TestRepositoryScanner:
         with pytest.raises(ScanError, match="not a directory"):
             scanner.scan()
 
-    def test_scan_empty_directory(self, tmp_path):
-        """Test scanning an empty directory."""
-        scanner = RepositoryScanner(root_path=str(tmp_path))
-        repos = scanner.scan()
-        assert repos == []
-
-    def test_scan_single_git_repo(self, tmp_path):
-        """Test scanning a directory with a single Git repository."""
-        # Create a fake .git directory
-        git_dir = tmp_path / ".git"
-        git_dir.mkdir()
-
-        scanner = RepositoryScanner(root_path=str(tmp_path))
-        repos = scanner.scan()
-
-        assert len(repos) == 1
-        assert repos[0] == tmp_path
-
-    def test_scan_nested_repos(self, tmp_path):
-        """Test scanning nested repositories."""
-        # Create nested structure: root/project1/.git and root/project2/.git
-        project1 = tmp_path / "project1"
-        project1.mkdir()
-        (project1 / ".git").mkdir()
-
-        project2 = tmp_path / "project2"
-        project2.mkdir()
-        (project2 / ".git").mkdir()
-
-        scanner = RepositoryScanner(root_path=str(tmp_path))
-        repos = scanner.scan()
-
-        assert len(repos) == 2
-        assert project1 in repos
-        assert project2 in repos
-
-    def test_scan_excludes_patterns(self, tmp_path):
-        """Test that excluded patterns are not scanned."""
-        # Create structure with node_modules
-        node_modules = tmp_path / "node_modules" / "package"
-        node_modules.mkdir(parents=True)
-        (node_modules / ".git").mkdir()
-
-        # Create a normal repo
-        project = tmp_path / "project"
-        project.mkdir()
-        (project / ".git").mkdir()
-
-        scanner = RepositoryScanner(root_path=str(tmp_path))
-        repos = scanner.scan()
-
-        # Should only find project, not node_modules
-        assert len(repos) == 1
-        assert project in repos
-        assert node_modules not in repos
-
-    def test_scan_excludes_hidden_dirs(self, tmp_path):
-        """Test that hidden directories (starting with .) are excluded."""
-        # Create hidden directory with git repo
-        hidden_dir = tmp_path / ".hidden" / "repo"
-        hidden_dir.mkdir(parents=True)
-        (hidden_dir / ".git").mkdir()
-
-        # Create a normal repo
-        project = tmp_path / "project"
-        project.mkdir()
-        (project / ".git").mkdir()
+    @pytest.mark.parametrize(
+        "paths, expected",
+        [
+            pytest.param([], [], id="empty"),
+            pytest.param([".git"], ["."], id="root_is_repo"),
+            pytest.param(["project1/.git", "project2/.git"], ["project1", "project2"], id="nested"),
+            # Nothing inside a repository is scanned, not even its .git directory
+            pytest.param([".git/nested/deep/.git"], ["."], id="no_descent_into_repos"),
+            pytest.param(["outer/.git", "outer/inner/.git"], ["outer"], id="nested_repo_skipped"),
+        ],
+    )
+    def test_scan_layouts(self, tmp_path, paths, expected):
+        """Test the repositories found for small directory layouts."""
+        build_tree(tmp_path, paths)
+
+        repos = RepositoryScanner(root_path=str(tmp_path)).scan()
+
+        assert repos == [tmp_path / path for path in expected]
+
+    def test_scan_excludes_patterns_and_hidden_dirs(self, repo_tree):
+        """Test that default excludes and hidden directories are not scanned."""
+        repos = RepositoryScanner(root_path=str(repo_tree)).scan()
+
+        # node_modules is a default exclude and .hidden is skipped as a hidden directory
+        assert repos == [
+            repo_tree / "alpha",
+            repo_tree / "beta",
+            repo_tree / "level1" / "level2" / "level3",
+            repo_tree / "old-project",
+            repo_tree / "zebra",
+        ]
+
+    def test_scan_returns_sorted_list(self, repo_tree):
+        """Test that scan returns a sorted list of repositories."""
+        repos = RepositoryScanner(root_path=str(repo_tree)).scan()
+        assert repos == sorted(repos)
 
-        scanner = RepositoryScanner(root_path=str(tmp_path))
+    def test_scan_excludes_glob_patterns(self, repo_tree):
+        """Test that glob-style exclude patterns are matched."""
+        scanner = RepositoryScanner(root_path=str(repo_tree), exclude_patterns=["old-*"])
         repos = scanner.scan()
 
-        # Should only find project, not hidden directory
-        assert len(repos) == 1
-        assert project in repos
+        assert repo_tree / "old-project" not in repos
+        assert repo_tree / "alpha" in repos
 
-    def test_scan_respects_max_depth(self, tmp_path):
+    def test_scan_respects_max_depth(self, repo_tree):
         """Test that max_depth is respected."""
-        # Create deep nested structure
-        deep = tmp_path / "level1" / "level2" / "level3"
-        deep.mkdir(parents=True)
-        (deep / ".git").mkdir()
+        deep = repo_tree / "level1" / "level2" / "level3"
 
         # Scanner with max_depth=2 should not find the repo
-        scanner = RepositoryScanner(root_path=str(tmp_path), max_depth=2)
-        repos = scanner.scan()
-        assert len(repos) == 0
+        assert deep not in RepositoryScanner(root_path=str(repo_tree), max_depth=2).scan()
 
         # Scanner with max_depth=3 should find it
-        scanner = RepositoryScanner(root_path=str(tmp_path), max_depth=3)
-        repos = scanner.scan()
-        assert len(repos) == 1
+        assert deep in RepositoryScanner(root_path=str(repo_tree), max_depth=3).scan()
+
+    def test_scan_detects_repos_from_directory_listing(self, tmp_path):
+        """Test that scanned directories are recognized from their listing, without a probe."""
+        repo = make_repo(tmp_path / "projects" / "repo")
+
+        scanner = RepositoryScanner(root_path=str(tmp_path), max_depth=5)
+        with patch.object(scanner, "is_git_repository", side_effect=AssertionError("probed")):
+            assert scanner.scan() == [repo]
 
     def test_is_git_repository(self, tmp_path):
         """Test is_git_repository method."""
@@ -146,37 +163,148 @@ class TestRepositoryScanner:
         non_git.mkdir()
         assert scanner.is_git_repository(non_git) is False
 
-    def test_scan_doesnt_descend_into_git_repos(self, tmp_path):
-        """Test that scanner doesn't descend into .git directories."""
-        # Create repo with nested structure inside .git
-        git_dir = tmp_path / ".git" / "nested" / "deep"
-        git_dir.mkdir(parents=True)
-        (git_dir / ".git").mkdir()  # This should not be found
+    def test_is_git_repository_gitlink_file(self, tmp_path):
+        """Test that a .git file (worktree or submodule gitlink) marks a repository."""
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/.git/worktrees/feature\n")
 
         scanner = RepositoryScanner(root_path=str(tmp_path))
-        repos = scanner.scan()
+        assert scanner.is_git_repository(tmp_path) is True
 
-        # Should only find the top-level repo
-        assert len(repos) == 1
-        assert repos[0] == tmp_path
+    def test_scan_finds_worktrees(self, tmp_path):
+        """Test that scanning finds worktrees whose .git is a file."""
+        repo = make_repo(tmp_path / "repo")
+        worktree = tmp_path / "repo-feature"
+        worktree.mkdir()
+        (worktree / ".git").write_text("gitdir: ../repo/.git/worktrees/repo-feature\n")
 
-    def test_scan_returns_sorted_list(self, tmp_path):
-        """Test that scan returns a sorted list of repositories."""
-        # Create repos in non-alphabetical order
-        (tmp_path / "zebra").mkdir()
-        (tmp_path / "zebra" / ".git").mkdir()
+        scanner = RepositoryScanner(root_path=str(tmp_path))
+        assert scanner.scan() == [repo, worktree]
+
+    def test_scan_many_repos_in_parallel(self, tmp_path):
+        """Test that parallel probing finds every repository in a wide, nested tree."""
+        expected = []
+        for group in ("group1", "group2", "group3"):
+            for i in range(10):
+                repo = make_repo(tmp_path / group / f"repo{i}")
+                expected.append(repo)
 
-        (tmp_path / "alpha").mkdir()
-        (tmp_path / "alpha" / ".git").mkdir()
+        scanner = RepositoryScanner(root_path=str(tmp_path), max_workers=4)
+        repos = scanner.scan()
+
+        assert repos == sorted(expected)
+
+    def test_scan_balances_single_top_level_directory(self, tmp_path):
+        """Test that a root with one top-level directory is still fully scanned."""
+        expected = []
+        for i in range(6):
+            repo = make_repo(tmp_path / "projects" / f"team{i}" / "repo")
+            expected.append(repo)
+
+        scanner = RepositoryScanner(root_path=str(tmp_path), max_workers=4)
+        with patch.object(scanner, "_scan_subtree", wraps=scanner._scan_subtree) as scan_subtree:
+            repos = scanner.scan()
+
+        assert repos == sorted(expected)
+        # The single "projects" directory was expanded into one subtree per team
+        assert scan_subtree.call_count == 6
+
+    def test_default_max_workers(self):
+        """Test that the default worker count scales with the CPU count, capped at 32."""
+        with patch("gittyup.scanner.os.cpu_count", return_value=2):
+            assert RepositoryScanner(root_path=".").max_workers == 8
+        with patch("gittyup.scanner.os.cpu_count", return_value=64):
+            assert RepositoryScanner(root_path=".").max_workers == 32
+
+    def test_iter_repositories_yields_every_repo(self, tmp_path):
+        """Test that streaming the scan finds the same repositories as scan()."""
+        expected = []
+        for group in ("group1", "group2"):
+            for i in range(5):
+                repo = make_repo(tmp_path / group / f"repo{i}")
+                expected.append(repo)
+
+        scanner = RepositoryScanner(root_path=str(tmp_path), max_workers=2)
+        repos = list(scanner.iter_repositories())
+
+        assert repos == sorted(expected)
+
+    def test_iter_repositories_sorted_across_subtrees(self, tmp_path):
+        """Test that the stream is sorted when some repos are found before the subtree walks."""
+        # a and c are found while expanding the top level; b's subdirectories
+        # outnumber the workers, so each becomes a separate subtree walk
+        build_tree(tmp_path, ["a/.git", "c/.git"] + [f"b/{i}/deep/.git" for i in range(5)])
+
+        scanner = RepositoryScanner(root_path=str(tmp_path), max_workers=4)
+
+        assert list(scanner.iter_repositories()) == scanner.scan()
+        assert scanner.scan()[0] == tmp_path / "a"
+        assert scanner.scan()[-1] == tmp_path / "c"
+
+    def test_iter_repositories_can_stop_early(self, tmp_path):
+        """Test that closing the stream after the first repository is safe."""
+        for i in range(5):
+            make_repo(tmp_path / f"repo{i}")
+
+        found = RepositoryScanner(root_path=str(tmp_path), max_workers=2).iter_repositories()
+        assert next(found).parent == tmp_path
+        found.close()
+
+    def test_iter_repositories_nonexistent_path(self):
+        """Test that the stream raises ScanError as soon as it is started."""
+        found = RepositoryScanner(root_path="/nonexistent/path/12345").iter_repositories()
+        with pytest.raises(ScanError, match="Path does not exist"):
+            next(found)
 
-        (tmp_path / "beta").mkdir()
-        (tmp_path / "beta" / ".git").mkdir()
+    def test_scan_does_not_follow_directory_symlinks(self, tmp_path):
+        """Test that symlinked directories, including loops, are not scanned."""
+        repo = make_repo(tmp_path / "real" / "repo")
+        (tmp_path / "linked").symlink_to(tmp_path / "real")
+        (tmp_path / "real" / "loop").symlink_to(tmp_path)
 
         scanner = RepositoryScanner(root_path=str(tmp_path))
         repos = scanner.scan()
 
-        # Check that results are sorted
-        assert len(repos) == 3
-        assert repos[0].name == "alpha"
-        assert repos[1].name == "beta"
-        assert repos[2].name == "zebra"
+        assert repos == [repo]
+
+    @pytest.mark.parametrize("max_depth", [1, 10], ids=["probed", "listed"])
+    def test_symlinked_git_dir_is_not_a_repo(self, tmp_path, max_depth):
+        """Test that a .git symlink doesn't mark a repository, at any depth."""
+        make_repo(tmp_path / "real")
+        (tmp_path / "fake").mkdir()
+        (tmp_path / "fake" / ".git").symlink_to(tmp_path / "real" / ".git")
+
+        repos = RepositoryScanner(root_path=str(tmp_path), max_depth=max_depth).scan()
+
+        assert repos == [tmp_path / "real"]
+
+
+class TestCompileExcludePatterns:
+    """Test suite for the exclude pattern compiler, which needs no filesystem."""
+
+    def test_plain_names_only(self):
+        """Test that plain names become a set lookup with no regex."""
+        names, regex = compile_exclude_patterns(["node_modules", "build"])
+        assert names == {"node_modules", "build"}
+        assert regex is None
+
+    @pytest.mark.parametrize(
+        "name, excluded",
+        [
+            ("old-project", True),
+            ("v1.tmp", True),
+            ("cache7", True),
+            ("project-old", False),
+            ("cache", False),
+        ],
+    )
+    def test_glob_patterns(self, name, excluded):
+        """Test that glob patterns match whole directory names through one regex."""
+        names, regex = compile_exclude_patterns(["dist", "old-*", "*.tmp", "cache[0-9]"])
+
+        assert names == {"dist"}
+        assert bool(regex.match(name)) is excluded
+
+    def test_non_string_pattern_rejected(self):
+        """Test that a non-string pattern raises ScanError instead of a TypeError."""
+        with pytest.raises(ScanError, match="Exclude patterns must be strings, got 2023"):
+            RepositoryScanner(root_path=".", exclude_patterns=["build", 2023])